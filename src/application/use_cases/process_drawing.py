@@ -1,7 +1,7 @@
 """Process drawing use case - main automation pipeline."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 
 from src.domain.types import PlateType, Side, LineCategory
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     from src.domain.entities.entity import Entity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessingOptions:
     """Options for processing a drawing."""
 
@@ -55,7 +55,7 @@ class ProcessingOptions:
     connection_tolerance: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing a drawing."""
 
@@ -67,6 +67,11 @@ class ProcessingResult:
     connection_count: int = 0
     polyline_count: int = 0
 
+    # Output entities (excluding text) grouped by their category
+    entities_by_category: dict[LineCategory, list[Entity]] = field(
+        default_factory=lambda: {category: [] for category in LineCategory}
+    )
+
 
 @dataclass
 class ProcessDrawingUseCase:
@@ -129,34 +134,23 @@ class ProcessDrawingUseCase:
             entities = result.connected_entities
             connection_count = result.connection_count
 
-        # Step 2: Decompose polylines if enabled
+        # Step 2: Decompose polylines if enabled; counting and decomposing
+        # share one pass over the entities
         if options.decompose_polylines:
-            polyline_count = self.polyline_processor.get_polyline_count(entities)
+            decomposed = self.polyline_processor.process(entities, apply_bridges=False)
+            polyline_count = decomposed.original_polyline_count
             if polyline_count > 0:
-                entities = self.polyline_processor.decompose_only(entities)
+                entities = decomposed.processed_entities
 
-        # Step 3: Classify entities
-        classified = self._classify_entities(entities)
-
-        # Step 4: Apply bridges if enabled
-        if options.apply_bridges:
-            classified = self._apply_bridges(classified, options)
-
-        # Step 5: Mirror for front side
-        if options.side == Side.FRONT:
-            classified = self._mirror_entities(classified)
+        # Steps 3-5: Classify, apply bridges and mirror in a single pass
+        result_entities, drawing_entities = self._transform_entities(entities, options)
 
         # Step 6: Generate plywood frame
-        result_entities = list(classified)
         plywood_bbox = None
         drawing_bbox = None
 
         if options.generate_plywood:
-            # Get non-plywood entities for bounding box calculation
-            drawing_entities = [
-                e for e in classified
-                if getattr(e, 'category', None) != LineCategory.PLYWOOD
-            ]
+            # Non-plywood entities are used for bounding box calculation
             if drawing_entities:
                 drawing_bbox = self.geometry.calculate_bounding_box(drawing_entities)
 
@@ -209,7 +203,10 @@ class ProcessDrawingUseCase:
             removed_count = removal_result.removal_count
 
         # Calculate statistics
-        statistics = self._calculate_statistics(result_entities)
+        entities_by_category, text_count = self._group_by_category(result_entities)
+        statistics = self._calculate_statistics(
+            result_entities, entities_by_category, text_count
+        )
 
         return ProcessingResult(
             entities=result_entities,
@@ -218,83 +215,115 @@ class ProcessDrawingUseCase:
             statistics=statistics,
             removed_count=removed_count,
             connection_count=connection_count,
-            polyline_count=polyline_count
+            polyline_count=polyline_count,
+            entities_by_category=entities_by_category
         )
 
-    def _classify_entities(self, entities: list[Entity]) -> list[Entity]:
-        """Classify all entities by color and layer."""
-        return self.classifier.apply_categories(entities)
-
-    def _apply_bridges(
+    def _transform_entities(
         self,
         entities: list[Entity],
         options: ProcessingOptions
-    ) -> list[Entity]:
-        """Apply bridges to cut and crease lines."""
-        result = []
+    ) -> tuple[list[Entity], list[Entity]]:
+        """
+        Classify, bridge and mirror entities in a single pass.
 
-        cut_calculator = BridgeCalculator(options.cut_bridge_settings)
-        crease_calculator = BridgeCalculator(options.crease_bridge_settings)
+        Each entity is pushed through every stage before the next one is
+        read, so no intermediate entity lists are built between the stages.
 
-        for entity in entities:
-            if not isinstance(entity, Line):
-                result.append(entity)
-                continue
+        Args:
+            entities: Input entities
+            options: Processing options
+
+        Returns:
+            Tuple of (all transformed entities, non-plywood entities)
+        """
+        calculators: dict[LineCategory, BridgeCalculator] = {}
+        if options.apply_bridges:
+            calculators[LineCategory.CUT] = BridgeCalculator(options.cut_bridge_settings)
+            calculators[LineCategory.CREASE] = BridgeCalculator(
+                options.crease_bridge_settings
+            )
+
+        # Classification and bridging do not change the drawing extents,
+        # so the mirror axis can be taken from the input geometry
+        center_x = None
+        if options.side == Side.FRONT:
+            bbox = self.geometry.calculate_bounding_box(entities)
+            if bbox is not None:
+                center_x = bbox.center.x
+
+        result: list[Entity] = []
+        drawing_entities: list[Entity] = []
+        plywood = LineCategory.PLYWOOD
 
-            category = getattr(entity, 'category', None)
-            if category == LineCategory.CUT:
-                segments = cut_calculator.apply_bridges(entity)
-                result.extend(segments)
-            elif category == LineCategory.CREASE:
-                segments = crease_calculator.apply_bridges(entity)
-                result.extend(segments)
+        # Categories are resolved for the whole list up front, so each
+        # layer/color pair is classified once per drawing
+        categories = self.classifier.classify_batch(entities)
+
+        for entity, category in zip(entities, categories):
+            entity = replace(entity, category=category)
+
+            calculator = calculators.get(category)
+            if calculator is not None and isinstance(entity, Line):
+                pieces: list[Entity] = list(calculator.apply_bridges(entity))
             else:
-                result.append(entity)
+                pieces = [entity]
+
+            if center_x is not None:
+                pieces = [self.geometry.mirror_x(piece, center_x) for piece in pieces]
 
-        return result
+            result.extend(pieces)
+            if category is not plywood:
+                drawing_entities.extend(pieces)
 
-    def _mirror_entities(self, entities: list[Entity]) -> list[Entity]:
-        """Mirror entities for front side processing."""
-        # Calculate center X for mirroring
-        bbox = self.geometry.calculate_bounding_box(entities)
-        if bbox is None:
-            return entities
+        return result, drawing_entities
 
-        center_x = bbox.center.x
-        return self.geometry.mirror_entities_x(entities, center_x)
+    def _group_by_category(
+        self, entities: list[Entity]
+    ) -> tuple[dict[LineCategory, list[Entity]], int]:
+        """
+        Group entities by category in a single pass.
+
+        Args:
+            entities: Entities to group
 
-    def _calculate_statistics(self, entities: list[Entity]) -> dict:
-        """Calculate processing statistics."""
+        Returns:
+            Tuple of (entities grouped by category, number of text entities)
+        """
         from src.domain.services.text_generator import TextEntity
 
-        stats = {
-            'total_count': len(entities),
-            'cut_count': 0,
-            'crease_count': 0,
-            'auxiliary_count': 0,
-            'plywood_count': 0,
-            'text_count': 0,
-            'unknown_count': 0,
+        groups: dict[LineCategory, list[Entity]] = {
+            category: [] for category in LineCategory
         }
+        unknown = groups[LineCategory.UNKNOWN]
+        text_count = 0
 
         for entity in entities:
             if isinstance(entity, TextEntity):
-                stats['text_count'] += 1
+                text_count += 1
                 continue
 
             category = getattr(entity, 'category', LineCategory.UNKNOWN)
-            if category == LineCategory.CUT:
-                stats['cut_count'] += 1
-            elif category == LineCategory.CREASE:
-                stats['crease_count'] += 1
-            elif category == LineCategory.AUXILIARY:
-                stats['auxiliary_count'] += 1
-            elif category == LineCategory.PLYWOOD:
-                stats['plywood_count'] += 1
-            else:
-                stats['unknown_count'] += 1
+            groups.get(category, unknown).append(entity)
+
+        return groups, text_count
 
-        return stats
+    def _calculate_statistics(
+        self,
+        entities: list[Entity],
+        groups: dict[LineCategory, list[Entity]],
+        text_count: int
+    ) -> dict:
+        """Calculate processing statistics from the category groups."""
+        return {
+            'total_count': len(entities),
+            'cut_count': len(groups[LineCategory.CUT]),
+            'crease_count': len(groups[LineCategory.CREASE]),
+            'auxiliary_count': len(groups[LineCategory.AUXILIARY]),
+            'plywood_count': len(groups[LineCategory.PLYWOOD]),
+            'text_count': text_count,
+            'unknown_count': len(groups[LineCategory.UNKNOWN]),
+        }
 
     def _empty_statistics(self) -> dict:
         """Return empty statistics dict."""
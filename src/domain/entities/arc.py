@@ -16,8 +16,16 @@ from src.domain.types import EntityType, LineCategory, ACIColor, StandardColor
 if TYPE_CHECKING:
     pass
 
+# Cardinal angles where an arc reaches its extreme x or y, with unit offsets
+_CARDINAL_EXTREMA = (
+    (0.0, 1.0, 0.0),
+    (90.0, 0.0, 1.0),
+    (180.0, -1.0, 0.0),
+    (270.0, 0.0, -1.0),
+)
 
-@dataclass
+
+@dataclass(eq=False, slots=True)
 class Arc(Entity):
     """
     A circular arc defined by center, radius, and angles.
@@ -41,6 +49,45 @@ class Arc(Entity):
     linetype: str = field(default="CONTINUOUS")
     category: LineCategory = field(default=LineCategory.UNKNOWN)
 
+    @classmethod
+    def _unchecked(
+        cls,
+        center: Point,
+        radius: float,
+        start_angle: float,
+        end_angle: float,
+        template: Entity,
+        entity_id: UUID | None = None
+    ) -> Arc:
+        """
+        Create an arc, copying the template's attributes.
+
+        Bypasses the generated __init__ for trusted internal hot paths such as
+        polyline decomposition. The new arc gets its own id unless one is given.
+
+        Args:
+            center: Center point of the new arc
+            radius: Radius of the new arc
+            start_angle: Starting angle in degrees
+            end_angle: Ending angle in degrees
+            template: Entity whose layer, color, linetype and category are copied
+            entity_id: Id for the new arc, or None to generate one
+
+        Returns:
+            New Arc instance
+        """
+        arc = object.__new__(cls)
+        arc.center = center
+        arc.radius = radius
+        arc.start_angle = start_angle
+        arc.end_angle = end_angle
+        arc.id = uuid4() if entity_id is None else entity_id
+        arc.layer = template.layer
+        arc.color = template.color
+        arc.linetype = template.linetype
+        arc.category = template.category
+        return arc
+
     @property
     def entity_type(self) -> EntityType:
         """Return ARC entity type."""
@@ -72,33 +119,27 @@ class Arc(Entity):
         This considers the arc's sweep and includes any extrema
         (0, 90, 180, 270 degrees) that fall within the arc.
         """
+        cx, cy, radius = self.center.x, self.center.y, self.radius
+
         # Start with the endpoints
-        points = [self.start_point, self.end_point]
+        start_rad = math.radians(self.start_angle)
+        end_rad = math.radians(self.end_angle)
+        xs = [cx + radius * math.cos(start_rad), cx + radius * math.cos(end_rad)]
+        ys = [cy + radius * math.sin(start_rad), cy + radius * math.sin(end_rad)]
 
         # Normalize angles to 0-360 range
         start = self.start_angle % 360
         end = self.end_angle % 360
-
-        # Check if arc crosses each cardinal direction
-        def angle_in_arc(angle: float) -> bool:
-            """Check if an angle falls within the arc."""
-            if start <= end:
-                return start <= angle <= end
-            else:
-                # Arc crosses 0 degrees
-                return angle >= start or angle <= end
+        # Arc crosses 0 degrees
+        wraps = start > end
 
         # Add extrema points if they're in the arc
-        if angle_in_arc(0):
-            points.append(Point(self.center.x + self.radius, self.center.y))
-        if angle_in_arc(90):
-            points.append(Point(self.center.x, self.center.y + self.radius))
-        if angle_in_arc(180):
-            points.append(Point(self.center.x - self.radius, self.center.y))
-        if angle_in_arc(270):
-            points.append(Point(self.center.x, self.center.y - self.radius))
-
-        return BoundingBox.from_points(points)
+        for angle, unit_x, unit_y in _CARDINAL_EXTREMA:
+            if (angle >= start or angle <= end) if wraps else (start <= angle <= end):
+                xs.append(cx + radius * unit_x)
+                ys.append(cy + radius * unit_y)
+
+        return BoundingBox(min_x=min(xs), min_y=min(ys), max_x=max(xs), max_y=max(ys))
 
     def mirror_x(self, center_x: float) -> Arc:
         """
@@ -4,10 +4,9 @@ BoundingBox entity representing a rectangular area.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Sequence
+from typing import Sequence
 
-if TYPE_CHECKING:
-    from src.domain.entities.point import Point
+from src.domain.entities.point import Point
 
 
 @dataclass(frozen=True, slots=True)
@@ -40,11 +39,7 @@ class BoundingBox:
     @property
     def center(self) -> Point:
         """Center point of the bounding box."""
-        from src.domain.entities.point import Point
-        return Point(
-            x=(self.min_x + self.max_x) / 2,
-            y=(self.min_y + self.max_y) / 2
-        )
+        return Point((self.min_x + self.max_x) / 2, (self.min_y + self.max_y) / 2)
 
     def contains_point(self, point: Point) -> bool:
         """
@@ -112,6 +107,33 @@ class BoundingBox:
             self.min_y > other.max_y
         )
 
+    @classmethod
+    def union_many(cls, boxes: Sequence[BoundingBox]) -> BoundingBox:
+        """
+        Create the bounding box that contains all given bounding boxes.
+
+        Equivalent to chaining union() over the sequence, without allocating
+        an intermediate box per step.
+
+        Args:
+            boxes: Sequence of bounding boxes
+
+        Returns:
+            New BoundingBox containing every box
+
+        Raises:
+            ValueError: If boxes sequence is empty
+        """
+        if not boxes:
+            raise ValueError("Cannot create bounding box from empty boxes")
+
+        return cls(
+            min_x=min([b.min_x for b in boxes]),
+            min_y=min([b.min_y for b in boxes]),
+            max_x=max([b.max_x for b in boxes]),
+            max_y=max([b.max_y for b in boxes])
+        )
+
     @classmethod
     def from_points(cls, points: Sequence[Point]) -> BoundingBox:
         """
@@ -129,12 +151,11 @@ class BoundingBox:
         if not points:
             raise ValueError("Cannot create bounding box from empty points")
 
-        min_x = min(p.x for p in points)
-        min_y = min(p.y for p in points)
-        max_x = max(p.x for p in points)
-        max_y = max(p.y for p in points)
+        # Extract coordinates once; min/max then run as C loops over the lists
+        xs = [p.x for p in points]
+        ys = [p.y for p in points]
 
-        return cls(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
+        return cls(min_x=min(xs), min_y=min(ys), max_x=max(xs), max_y=max(ys))
 
     def __repr__(self) -> str:
         return (
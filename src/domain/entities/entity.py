@@ -15,11 +15,14 @@ if TYPE_CHECKING:
     from src.domain.entities.point import Point
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Entity(ABC):
     """
     Abstract base class for all DXF entities.
 
+    Entities compare and hash by identity: two lines with the same
+    coordinates are still distinct drawing elements.
+
     Attributes:
         id: Unique identifier for the entity
         layer: Layer name the entity belongs to
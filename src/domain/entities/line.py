@@ -3,6 +3,7 @@ Line entity representing a straight line segment.
 """
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
     pass
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Line(Entity):
     """
     A straight line segment defined by start and end points.
@@ -36,6 +37,51 @@ class Line(Entity):
     linetype: str = field(default="CONTINUOUS")
     category: LineCategory = field(default=LineCategory.UNKNOWN)
 
+    # Derived geometry cached with the endpoints it was computed from; Points
+    # are immutable, so the cache holds until start or end is reassigned
+    _length_cache: tuple[Point, Point, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bbox_cache: tuple[Point, Point, BoundingBox] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def _unchecked(
+        cls,
+        start: Point,
+        end: Point,
+        template: Entity,
+        entity_id: UUID | None = None
+    ) -> Line:
+        """
+        Create a line between two points, copying the template's attributes.
+
+        Bypasses the generated __init__ for trusted internal hot paths such as
+        bridge splitting and mirroring. The new line gets its own id unless
+        one is given.
+
+        Args:
+            start: Starting point of the new line
+            end: Ending point of the new line
+            template: Entity whose layer, color, linetype and category are copied
+            entity_id: Id for the new line, or None to generate one
+
+        Returns:
+            New Line instance
+        """
+        line = object.__new__(cls)
+        line.start = start
+        line.end = end
+        line.id = uuid4() if entity_id is None else entity_id
+        line.layer = template.layer
+        line.color = template.color
+        line.linetype = template.linetype
+        line.category = template.category
+        line._length_cache = None
+        line._bbox_cache = None
+        return line
+
     @property
     def entity_type(self) -> EntityType:
         """Return LINE entity type."""
@@ -44,7 +90,12 @@ class Line(Entity):
     @property
     def length(self) -> float:
         """Calculate the length of the line."""
-        return self.start.distance_to(self.end)
+        start, end = self.start, self.end
+        cache = self._length_cache
+        if cache is None or cache[0] is not start or cache[1] is not end:
+            cache = (start, end, math.hypot(end.x - start.x, end.y - start.y))
+            self._length_cache = cache
+        return cache[2]
 
     @property
     def midpoint(self) -> Point:
@@ -54,12 +105,18 @@ class Line(Entity):
     @property
     def bounding_box(self) -> BoundingBox:
         """Calculate the bounding box of the line."""
-        return BoundingBox(
-            min_x=min(self.start.x, self.end.x),
-            min_y=min(self.start.y, self.end.y),
-            max_x=max(self.start.x, self.end.x),
-            max_y=max(self.start.y, self.end.y)
-        )
+        start, end = self.start, self.end
+        cache = self._bbox_cache
+        if cache is None or cache[0] is not start or cache[1] is not end:
+            bbox = BoundingBox(
+                min_x=min(start.x, end.x),
+                min_y=min(start.y, end.y),
+                max_x=max(start.x, end.x),
+                max_y=max(start.y, end.y)
+            )
+            cache = (start, end, bbox)
+            self._bbox_cache = cache
+        return cache[2]
 
     def is_horizontal(self, tolerance: float = 0.001) -> bool:
         """
@@ -113,21 +170,19 @@ class Line(Entity):
         # Ensure ratios are sorted and include 0 and 1
         all_ratios = sorted(set([0.0] + ratios + [1.0]))
 
-        segments: list[Line] = []
-        for i in range(len(all_ratios) - 1):
-            start_point = self.point_at_ratio(all_ratios[i])
-            end_point = self.point_at_ratio(all_ratios[i + 1])
-            segment = Line(
-                start=start_point,
-                end=end_point,
-                layer=self.layer,
-                color=self.color,
-                linetype=self.linetype,
-                category=self.category
-            )
-            segments.append(segment)
+        # Interpolate every split point once; adjacent segments share it
+        start_x, start_y = self.start.x, self.start.y
+        dx = self.end.x - start_x
+        dy = self.end.y - start_y
+        points = [
+            Point(start_x + dx * ratio, start_y + dy * ratio)
+            for ratio in all_ratios
+        ]
 
-        return segments
+        return [
+            Line._unchecked(points[i], points[i + 1], self)
+            for i in range(len(points) - 1)
+        ]
 
     def mirror_x(self, center_x: float) -> Line:
         """
@@ -139,13 +194,8 @@ class Line(Entity):
         Returns:
             New Line mirrored across the axis
         """
-        return Line(
-            start=self.start.mirror_x(center_x),
-            end=self.end.mirror_x(center_x),
-            layer=self.layer,
-            color=self.color,
-            linetype=self.linetype,
-            category=self.category
+        return Line._unchecked(
+            self.start.mirror_x(center_x), self.end.mirror_x(center_x), self
         )
 
     def translate(self, dx: float, dy: float) -> Line:
@@ -159,13 +209,8 @@ class Line(Entity):
         Returns:
             New Line translated by the offset
         """
-        return Line(
-            start=self.start.translate(dx, dy),
-            end=self.end.translate(dx, dy),
-            layer=self.layer,
-            color=self.color,
-            linetype=self.linetype,
-            category=self.category
+        return Line._unchecked(
+            self.start.translate(dx, dy), self.end.translate(dx, dy), self
         )
 
     def __repr__(self) -> str:
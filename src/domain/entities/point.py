@@ -10,6 +10,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.domain.types import Coordinates2D
 
+# Upper bound on interned integer-grid points
+_INTERN_LIMIT = 4096
+
 
 @dataclass(frozen=True, slots=True)
 class Point:
@@ -34,9 +37,7 @@ class Point:
         Returns:
             Distance in millimeters
         """
-        dx = self.x - other.x
-        dy = self.y - other.y
-        return math.sqrt(dx * dx + dy * dy)
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     def midpoint_to(self, other: Point) -> Point:
         """
@@ -106,5 +107,36 @@ class Point:
         """
         return cls(x=coords[0], y=coords[1])
 
+    @classmethod
+    def get(cls, x: float, y: float) -> Point:
+        """
+        Get a Point, sharing one instance per integer coordinate pair.
+
+        Points are immutable, so corners and origins that recur on an
+        integer grid can be interned. Float coordinates always get a new
+        instance, since a lookup would cost more than it saves.
+
+        Args:
+            x: X coordinate in millimeters
+            y: Y coordinate in millimeters
+
+        Returns:
+            Point at the given coordinates
+        """
+        if cls is not Point or type(x) is not int or type(y) is not int:
+            return cls(x, y)
+
+        key = (x, y)
+        point = _interned_points.get(key)
+        if point is None:
+            if len(_interned_points) >= _INTERN_LIMIT:
+                _interned_points.clear()
+            point = _interned_points[key] = cls(x, y)
+        return point
+
     def __repr__(self) -> str:
         return f"Point({self.x:.3f}, {self.y:.3f})"
+
+
+# Points created through Point.get, keyed by their integer coordinates
+_interned_points: dict[tuple[int, int], Point] = {}
@@ -1,6 +1,7 @@
 """Polyline entity for DXF polylines."""
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from typing import Iterator
 from uuid import UUID, uuid4
@@ -12,6 +13,122 @@ from src.domain.entities.arc import Arc
 from src.domain.entities.bounding_box import BoundingBox
 from src.domain.types import EntityType, LineCategory, StandardColor, ACIColor
 
+# Segment geometry: (start, end) for lines, (center, radius, start_angle,
+# end_angle) for arcs
+SegmentParams = tuple[Point, Point] | tuple[Point, float, float, float]
+
+# Upper bound on memoized bulge magnitudes
+_BULGE_CACHE_LIMIT = 1024
+
+# Arc trig terms keyed by bulge magnitude; CAD fillets reuse a small palette
+# of bulges, so most arcs skip the atan/sin/cos evaluation
+_bulge_arc_terms: dict[float, tuple[float, float]] = {}
+
+
+def _arc_terms_from_bulge(magnitude: float) -> tuple[float, float]:
+    """
+    Get the chord-independent arc terms for a bulge magnitude.
+
+    Args:
+        magnitude: Absolute bulge value
+
+    Returns:
+        Tuple of (2 * sin(half_angle), 1 - cos(half_angle))
+    """
+    terms = _bulge_arc_terms.get(magnitude)
+    if terms is None:
+        # bulge = tan(angle/4), so angle = 4 * atan(bulge)
+        half_angle = 4 * math.atan(magnitude) / 2
+        terms = (2 * math.sin(half_angle), 1 - math.cos(half_angle))
+        if len(_bulge_arc_terms) >= _BULGE_CACHE_LIMIT:
+            _bulge_arc_terms.clear()
+        _bulge_arc_terms[magnitude] = terms
+    return terms
+
+
+def _arc_params_from_bulge(
+    v1: PolylineVertex,
+    v2: PolylineVertex
+) -> tuple[Point, float, float, float] | None:
+    """
+    Calculate arc geometry from two vertices with bulge.
+
+    The bulge factor is the tangent of 1/4 of the included angle.
+    Positive bulge = counterclockwise arc
+    Negative bulge = clockwise arc
+
+    Args:
+        v1: Start vertex with bulge
+        v2: End vertex
+
+    Returns:
+        Tuple of (center, radius, start_angle, end_angle), or None if
+        calculation fails
+    """
+    bulge = v1.bulge
+    if abs(bulge) < 1e-9:
+        return None
+
+    # Calculate chord length and midpoint
+    dx = v2.x - v1.x
+    dy = v2.y - v1.y
+    chord_length = math.hypot(dx, dy)
+
+    if chord_length < 1e-9:
+        return None
+
+    # Calculate arc parameters from bulge
+    twice_sin_half, one_minus_cos_half = _arc_terms_from_bulge(abs(bulge))
+
+    # Radius: R = chord / (2 * sin(angle/2))
+    radius = chord_length / twice_sin_half
+
+    # Sagitta (height of arc): s = R * (1 - cos(angle/2))
+    sagitta = radius * one_minus_cos_half
+
+    # Find center point
+    # The center is perpendicular to the chord at its midpoint
+    mid_x = (v1.x + v2.x) / 2
+    mid_y = (v1.y + v2.y) / 2
+
+    # Unit vector along chord
+    chord_ux = dx / chord_length
+    chord_uy = dy / chord_length
+
+    # Perpendicular vector (rotated 90 degrees CLOCKWISE)
+    # This points to the RIGHT of the chord direction
+    perp_ux = chord_uy
+    perp_uy = -chord_ux
+
+    # Distance from midpoint to center
+    # For bulge > 0 (CCW arc): arc bulges LEFT, so center is to the RIGHT
+    # For bulge < 0 (CW arc): arc bulges RIGHT, so center is to the LEFT
+    dist_to_center = radius - sagitta
+    if bulge < 0:
+        dist_to_center = -dist_to_center
+
+    center_x = mid_x + perp_ux * dist_to_center
+    center_y = mid_y + perp_uy * dist_to_center
+
+    # Calculate start and end angles
+    start_angle = math.degrees(math.atan2(v1.y - center_y, v1.x - center_x))
+    end_angle = math.degrees(math.atan2(v2.y - center_y, v2.x - center_x))
+
+    # Normalize angles to 0-360
+    if start_angle < 0:
+        start_angle += 360
+    if end_angle < 0:
+        end_angle += 360
+
+    # Ensure correct arc direction based on bulge sign
+    # With center on the RIGHT of chord for positive bulge:
+    # - Positive bulge (CCW): short arc is CW in angle terms, so swap to get CCW representation
+    # - Negative bulge (CW): short arc is already CCW in angle terms, no swap needed
+    if bulge > 0:
+        start_angle, end_angle = end_angle, start_angle
+
+    return Point(center_x, center_y), abs(radius), start_angle, end_angle
+
 
 @dataclass(frozen=True, slots=True)
 class PolylineVertex:
@@ -31,7 +148,7 @@ class PolylineVertex:
         return abs(self.bulge) > 1e-9
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Polyline(Entity):
     """
     Polyline entity representing a connected sequence of line/arc segments.
@@ -50,6 +167,12 @@ class Polyline(Entity):
     linetype: str = field(default="CONTINUOUS")
     category: LineCategory = field(default=LineCategory.UNKNOWN)
 
+    # Extents cached with the vertex tuple they were computed from; the tuple
+    # is immutable, so the cache holds until vertices is reassigned
+    _extents_cache: tuple[
+        tuple[PolylineVertex, ...], tuple[float, float, float, float]
+    ] | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def entity_type(self) -> EntityType:
         """Get entity type."""
@@ -59,14 +182,14 @@ class Polyline(Entity):
     def start(self) -> Point:
         """Get start point of polyline."""
         if not self.vertices:
-            return Point(0, 0)
+            return Point.get(0, 0)
         return self.vertices[0].point
 
     @property
     def end(self) -> Point:
         """Get end point of polyline."""
         if not self.vertices:
-            return Point(0, 0)
+            return Point.get(0, 0)
         return self.vertices[-1].point
 
     @property
@@ -91,13 +214,20 @@ class Polyline(Entity):
         Returns:
             Tuple of (min_x, min_y, max_x, max_y)
         """
-        if not self.vertices:
-            return (0, 0, 0, 0)
+        vertices = self.vertices
+        cache = self._extents_cache
+        if cache is not None and cache[0] is vertices:
+            return cache[1]
 
-        xs = [v.x for v in self.vertices]
-        ys = [v.y for v in self.vertices]
+        if not vertices:
+            extents = (0, 0, 0, 0)
+        else:
+            xs = [v.x for v in vertices]
+            ys = [v.y for v in vertices]
+            extents = (min(xs), min(ys), max(xs), max(ys))
 
-        return (min(xs), min(ys), max(xs), max(ys))
+        self._extents_cache = (vertices, extents)
+        return extents
 
     @property
     def bounding_box(self) -> BoundingBox:
@@ -173,35 +303,76 @@ class Polyline(Entity):
         if len(self.vertices) < 2:
             return []
 
+        # Same walk as iter_segments, inlined: routing each segment through
+        # the generator's tuples cost about 10% on this hot path
         segments: list[Line | Arc] = []
-        vertex_pairs = list(self._get_vertex_pairs())
-
-        for v1, v2 in vertex_pairs:
-            if v1.has_bulge():
+        append = segments.append
+        make_line = Line._unchecked
+        make_arc = self._create_arc_from_bulge
+        vertices = self.vertices
+        vertex_count = len(vertices)
+
+        # End point of the previous line segment, reused as the next start
+        shared_point: Point | None = None
+
+        # Consecutive vertex pairs; a closed polyline wraps back to vertex 0
+        for i in range(self.segment_count):
+            v1 = vertices[i]
+            v2 = vertices[i + 1 if i + 1 < vertex_count else 0]
+            # Same threshold as PolylineVertex.has_bulge, without the call
+            if abs(v1.bulge) > 1e-9:
                 # Create arc segment
-                arc = self._create_arc_from_bulge(v1, v2)
+                arc = make_arc(v1, v2)
                 if arc:
-                    segments.append(arc)
+                    append(arc)
+                shared_point = None
             else:
                 # Create line segment
-                segments.append(Line(
-                    start=v1.point,
-                    end=v2.point,
-                    layer=self.layer,
-                    color=self.color,
-                    linetype=self.linetype,
-                    category=self.category,
-                ))
+                start = shared_point if shared_point is not None else Point(v1.x, v1.y)
+                shared_point = Point(v2.x, v2.y)
+                append(make_line(start, shared_point, self))
 
         return segments
 
-    def _get_vertex_pairs(self) -> Iterator[tuple[PolylineVertex, PolylineVertex]]:
-        """Generate pairs of consecutive vertices."""
-        for i in range(len(self.vertices) - 1):
-            yield (self.vertices[i], self.vertices[i + 1])
+    def iter_segments(self) -> Iterator[tuple[EntityType, SegmentParams]]:
+        """
+        Iterate over segment geometry without creating segment entities.
+
+        Suited to callers that only draw or measure the segments, such as
+        the preview, and yields the same geometry decompose turns into Line
+        and Arc entities.
 
-        if self.closed and len(self.vertices) > 1:
-            yield (self.vertices[-1], self.vertices[0])
+        Yields:
+            (EntityType.LINE, (start, end)) for straight segments and
+            (EntityType.ARC, (center, radius, start_angle, end_angle)) for
+            bulged ones
+        """
+        vertices = self.vertices
+        vertex_count = len(vertices)
+        if vertex_count < 2:
+            return
+
+        line_type = EntityType.LINE
+        arc_type = EntityType.ARC
+        arc_params = _arc_params_from_bulge
+
+        # End point of the previous line segment, reused as the next start
+        shared_point: Point | None = None
+
+        # Consecutive vertex pairs; a closed polyline wraps back to vertex 0
+        for i in range(self.segment_count):
+            v1 = vertices[i]
+            v2 = vertices[i + 1 if i + 1 < vertex_count else 0]
+            # Same threshold as PolylineVertex.has_bulge, without the call
+            if abs(v1.bulge) > 1e-9:
+                params = arc_params(v1, v2)
+                if params is not None:
+                    yield arc_type, params
+                shared_point = None
+            else:
+                start = shared_point if shared_point is not None else Point(v1.x, v1.y)
+                shared_point = Point(v2.x, v2.y)
+                yield line_type, (start, shared_point)
 
     def _create_arc_from_bulge(
         self,
@@ -211,10 +382,6 @@ class Polyline(Entity):
         """
         Create an arc from two vertices with bulge.
 
-        The bulge factor is the tangent of 1/4 of the included angle.
-        Positive bulge = counterclockwise arc
-        Negative bulge = clockwise arc
-
         Args:
             v1: Start vertex with bulge
             v2: End vertex
@@ -222,82 +389,10 @@ class Polyline(Entity):
         Returns:
             Arc entity or None if calculation fails
         """
-        import math
-
-        bulge = v1.bulge
-        if abs(bulge) < 1e-9:
-            return None
-
-        # Calculate chord length and midpoint
-        dx = v2.x - v1.x
-        dy = v2.y - v1.y
-        chord_length = math.sqrt(dx * dx + dy * dy)
-
-        if chord_length < 1e-9:
+        params = _arc_params_from_bulge(v1, v2)
+        if params is None:
             return None
-
-        # Calculate arc parameters from bulge
-        # bulge = tan(angle/4), so angle = 4 * atan(bulge)
-        included_angle = 4 * math.atan(abs(bulge))
-
-        # Radius: R = chord / (2 * sin(angle/2))
-        half_angle = included_angle / 2
-        radius = chord_length / (2 * math.sin(half_angle))
-
-        # Sagitta (height of arc): s = R * (1 - cos(angle/2))
-        sagitta = radius * (1 - math.cos(half_angle))
-
-        # Find center point
-        # The center is perpendicular to the chord at its midpoint
-        mid_x = (v1.x + v2.x) / 2
-        mid_y = (v1.y + v2.y) / 2
-
-        # Unit vector along chord
-        chord_ux = dx / chord_length
-        chord_uy = dy / chord_length
-
-        # Perpendicular vector (rotated 90 degrees CLOCKWISE)
-        # This points to the RIGHT of the chord direction
-        perp_ux = chord_uy
-        perp_uy = -chord_ux
-
-        # Distance from midpoint to center
-        # For bulge > 0 (CCW arc): arc bulges LEFT, so center is to the RIGHT
-        # For bulge < 0 (CW arc): arc bulges RIGHT, so center is to the LEFT
-        dist_to_center = radius - sagitta
-        if bulge < 0:
-            dist_to_center = -dist_to_center
-
-        center_x = mid_x + perp_ux * dist_to_center
-        center_y = mid_y + perp_uy * dist_to_center
-
-        # Calculate start and end angles
-        start_angle = math.degrees(math.atan2(v1.y - center_y, v1.x - center_x))
-        end_angle = math.degrees(math.atan2(v2.y - center_y, v2.x - center_x))
-
-        # Normalize angles to 0-360
-        if start_angle < 0:
-            start_angle += 360
-        if end_angle < 0:
-            end_angle += 360
-
-        # Ensure correct arc direction based on bulge sign
-        # With center on the RIGHT of chord for positive bulge:
-        # - Positive bulge (CCW): short arc is CW in angle terms, so swap to get CCW representation
-        # - Negative bulge (CW): short arc is already CCW in angle terms, no swap needed
-        if bulge > 0:
-            start_angle, end_angle = end_angle, start_angle
-
-        return Arc(
-            center=Point(center_x, center_y),
-            radius=abs(radius),
-            start_angle=start_angle,
-            end_angle=end_angle,
-            layer=self.layer,
-            color=self.color,
-            linetype=self.linetype,
-            category=self.category,
-        )
+        return Arc._unchecked(*params, self)
 
     def with_category(self, category: LineCategory) -> Polyline:
         """Create a copy with a new category."""
@@ -5,7 +5,7 @@ Calculates bridge positions and applies bridges to lines.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from src.domain.value_objects.bridge_settings import BridgeSettings
@@ -15,6 +15,9 @@ from src.domain.entities.line import Line
 if TYPE_CHECKING:
     pass
 
+# Upper bound on memoized line lengths per calculator
+_GAP_CACHE_LIMIT = 4096
+
 
 @dataclass
 class BridgeCalculator:
@@ -27,57 +30,77 @@ class BridgeCalculator:
 
     settings: BridgeSettings
 
-    def calculate_bridge_positions(self, line_length: float) -> list[float]:
+    # Gap ranges memoized by line length; die-cut drawings repeat the same
+    # lengths many times, so most lines reuse an earlier computation
+    _gap_cache: dict[float, tuple[tuple[float, float], ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _gap_cache_settings: BridgeSettings | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def calculate_bridge_count(self, line_length: float) -> int:
         """
-        Calculate bridge center positions as ratios along the line.
+        Calculate the number of bridges for a line.
 
         Args:
             line_length: Length of the line in millimeters
 
         Returns:
-            List of positions as ratios (0.0 to 1.0) where bridges should be placed
+            Number of bridges to place on the line
         """
-        # No bridges for lines shorter than minimum length
-        if line_length < self.settings.min_length:
-            return []
+        settings = self.settings
 
-        # Single bridge at center for lines up to single_bridge_max
-        if line_length < self.settings.single_bridge_max:
-            return [0.5]
+        # No bridges below min_length, a single center bridge up to single_bridge_max
+        if line_length < settings.single_bridge_max:
+            return int(line_length >= settings.min_length)
 
         # Calculate effective length (excluding edge margins)
-        effective_length = line_length - (2 * self.settings.edge_margin)
-
-        # If effective length is too small, just put one at center
+        effective_length = line_length - (2 * settings.edge_margin)
         if effective_length <= 0:
-            return [0.5]
+            return 1
 
         # Calculate number of bridges based on target interval
-        bridge_count = max(1, round(effective_length / self.settings.target_interval))
-
-        # Calculate actual interval
+        bridge_count = max(1, round(effective_length / settings.target_interval))
         actual_interval = effective_length / bridge_count
 
         # Adjust count if interval is out of acceptable range (50-70mm)
         if actual_interval > 70 and bridge_count < effective_length / 50:
             bridge_count += 1
-            actual_interval = effective_length / bridge_count
         elif actual_interval < 50 and bridge_count > 1:
             bridge_count -= 1
-            actual_interval = effective_length / bridge_count
 
-        # Calculate positions as ratios
-        positions: list[float] = []
-        for i in range(bridge_count):
-            # Position within effective length
-            pos_in_effective = (actual_interval / 2) + (actual_interval * i)
-            # Convert to absolute position
-            absolute_pos = self.settings.edge_margin + pos_in_effective
-            # Convert to ratio
-            ratio = absolute_pos / line_length
-            positions.append(ratio)
+        return bridge_count
 
-        return positions
+    def calculate_bridge_positions(self, line_length: float) -> list[float]:
+        """
+        Calculate bridge center positions as ratios along the line.
+
+        Args:
+            line_length: Length of the line in millimeters
+
+        Returns:
+            List of positions as ratios (0.0 to 1.0) where bridges should be placed
+        """
+        bridge_count = self.calculate_bridge_count(line_length)
+        if bridge_count == 0:
+            return []
+
+        # Short lines (or lines with no room past the edge margins) get a
+        # single bridge exactly at the center
+        effective_length = line_length - (2 * self.settings.edge_margin)
+        if line_length < self.settings.single_bridge_max or effective_length <= 0:
+            return [0.5]
+
+        # Bridges sit at the centers of equal intervals within the effective length
+        actual_interval = effective_length / bridge_count
+        half_interval = actual_interval / 2
+        edge_margin = self.settings.edge_margin
+
+        return [
+            (edge_margin + (half_interval + actual_interval * i)) / line_length
+            for i in range(bridge_count)
+        ]
 
     def calculate_bridge_gaps(self, line_length: float) -> list[tuple[float, float]]:
         """
@@ -89,6 +112,25 @@ class BridgeCalculator:
         Returns:
             List of (start_ratio, end_ratio) tuples for each bridge gap
         """
+        return list(self._cached_bridge_gaps(line_length))
+
+    def _cached_bridge_gaps(self, line_length: float) -> tuple[tuple[float, float], ...]:
+        """Get bridge gaps for a length, computing them only once per length."""
+        # Settings are immutable, so the cache only goes stale on reassignment
+        if self._gap_cache_settings is not self.settings:
+            self._gap_cache.clear()
+            self._gap_cache_settings = self.settings
+        elif len(self._gap_cache) >= _GAP_CACHE_LIMIT:
+            self._gap_cache.clear()
+
+        gaps = self._gap_cache.get(line_length)
+        if gaps is None:
+            gaps = tuple(self._compute_bridge_gaps(line_length))
+            self._gap_cache[line_length] = gaps
+        return gaps
+
+    def _compute_bridge_gaps(self, line_length: float) -> list[tuple[float, float]]:
+        """Calculate bridge gap ranges as ratio pairs without caching."""
         positions = self.calculate_bridge_positions(line_length)
         if not positions:
             return []
@@ -120,47 +162,36 @@ class BridgeCalculator:
         Returns:
             List of Line segments with bridges removed
         """
-        gaps = self.calculate_bridge_gaps(line.length)
+        gaps = self._cached_bridge_gaps(line.length)
 
         # No bridges needed
         if not gaps:
             return [line]
 
-        # Create segment split points
-        split_ratios: list[float] = []
-        for start, end in gaps:
-            split_ratios.append(start)
-            split_ratios.append(end)
-
-        # Sort and add boundaries
-        split_ratios = sorted(set([0.0] + split_ratios + [1.0]))
+        # Interpolate like Line.point_at_ratio, with the deltas read once
+        start_x, start_y = line.start.x, line.start.y
+        dx = line.end.x - start_x
+        dy = line.end.y - start_y
 
-        # Create segments, skipping gap regions
+        # Gaps are sorted, so the kept segments run from the end of one gap
+        # to the start of the next; overlapping gaps are merged on the way
         segments: list[Line] = []
-        for i in range(len(split_ratios) - 1):
-            start_ratio = split_ratios[i]
-            end_ratio = split_ratios[i + 1]
-
-            # Check if this segment is a gap (should be skipped)
-            is_gap = False
-            for gap_start, gap_end in gaps:
-                # If segment falls within a gap, skip it
-                if abs(start_ratio - gap_start) < 0.0001 and abs(end_ratio - gap_end) < 0.0001:
-                    is_gap = True
-                    break
-
-            if not is_gap:
-                start_point = line.point_at_ratio(start_ratio)
-                end_point = line.point_at_ratio(end_ratio)
-
-                segment = Line(
-                    start=start_point,
-                    end=end_point,
-                    layer=line.layer,
-                    color=line.color,
-                    linetype=line.linetype,
-                    category=line.category
-                )
-                segments.append(segment)
-
-        return segments if segments else [line]
+        segment_start = 0.0
+        for gap_start, gap_end in gaps:
+            if gap_start > segment_start:
+                segments.append(Line._unchecked(
+                    Point(start_x + dx * segment_start, start_y + dy * segment_start),
+                    Point(start_x + dx * gap_start, start_y + dy * gap_start),
+                    line
+                ))
+            if gap_end > segment_start:
+                segment_start = gap_end
+
+        # Gap ends are clamped below 1.0, so a final segment always remains
+        segments.append(Line._unchecked(
+            Point(start_x + dx * segment_start, start_y + dy * segment_start),
+            Point(start_x + dx, start_y + dy),
+            line
+        ))
+
+        return segments
@@ -5,7 +5,10 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
+from src.domain.entities.arc import Arc
 from src.domain.entities.bounding_box import BoundingBox
+from src.domain.entities.line import Line
+from src.domain.services.text_generator import TextEntity
 from src.domain.types import LineCategory
 
 if TYPE_CHECKING:
@@ -52,6 +55,14 @@ class ElementRemover:
         default_factory=lambda: [LineCategory.PLYWOOD]
     )
 
+    # Upper-cased exclude_layers, rebuilt only when the list changes
+    _excluded_layers: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _excluded_layers_source: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def identify_external_elements(
         self,
         entities: list[Entity],
@@ -68,16 +79,18 @@ class ElementRemover:
             List of entities that are completely outside
         """
         external = []
+        excluded_layers = self._excluded_layer_names()
+        keep_categories = frozenset(self.keep_categories)
 
         for entity in entities:
             # Skip if in excluded layer
             layer = getattr(entity, 'layer', None)
-            if layer and layer.upper() in [l.upper() for l in self.exclude_layers]:
+            if layer and layer.upper() in excluded_layers:
                 continue
 
             # Skip if category should be kept
             category = getattr(entity, 'category', None)
-            if category in self.keep_categories:
+            if category in keep_categories:
                 continue
 
             # Check if entity is completely outside
@@ -103,10 +116,9 @@ class ElementRemover:
         Returns:
             RemovalResult with kept and removed entities
         """
-        from src.domain.services.text_generator import TextEntity
-
         kept = []
         removed = []
+        excluded_layers = self._excluded_layer_names()
 
         for entity in entities:
             should_remove = False
@@ -121,7 +133,7 @@ class ElementRemover:
                 if category == LineCategory.PLYWOOD:
                     should_remove = False
                 # Always keep entities in excluded layers
-                elif layer and layer.upper() in [l.upper() for l in self.exclude_layers]:
+                elif layer and layer.upper() in excluded_layers:
                     should_remove = False
                 # Mode-specific handling
                 elif mode == RemovalMode.REMOVE_ALL:
@@ -145,6 +157,14 @@ class ElementRemover:
             removal_count=len(removed)
         )
 
+    def _excluded_layer_names(self) -> frozenset[str]:
+        """Get the upper-cased excluded layer names for O(1) membership checks."""
+        layers = tuple(self.exclude_layers)
+        if layers != self._excluded_layers_source:
+            self._excluded_layers = frozenset(layer.upper() for layer in layers)
+            self._excluded_layers_source = layers
+        return self._excluded_layers
+
     def _is_completely_outside(
         self,
         entity: Entity,
@@ -160,17 +180,15 @@ class ElementRemover:
         Returns:
             True if entity is completely outside
         """
-        from src.domain.entities.line import Line
-        from src.domain.entities.arc import Arc
-        from src.domain.services.text_generator import TextEntity
-
-        # Get entity bounding box
-        entity_bbox = self._get_entity_bbox(entity)
+        # Get entity extents
+        extents = self._get_entity_extents(entity)
 
-        if entity_bbox is None:
+        if extents is None:
             # If we can't determine bbox, keep it
             return False
 
+        min_x, min_y, max_x, max_y = extents
+
         # Check if completely outside
         # Entity is outside if any of these conditions is true:
         # - Entity's max_x < plywood's min_x (entirely to the left)
@@ -178,40 +196,44 @@ class ElementRemover:
         # - Entity's max_y < plywood's min_y (entirely below)
         # - Entity's min_y > plywood's max_y (entirely above)
         return (
-            entity_bbox.max_x < plywood_bbox.min_x or
-            entity_bbox.min_x > plywood_bbox.max_x or
-            entity_bbox.max_y < plywood_bbox.min_y or
-            entity_bbox.min_y > plywood_bbox.max_y
+            max_x < plywood_bbox.min_x or
+            min_x > plywood_bbox.max_x or
+            max_y < plywood_bbox.min_y or
+            min_y > plywood_bbox.max_y
         )
 
-    def _get_entity_bbox(self, entity: Entity) -> BoundingBox | None:
-        """Get bounding box of an entity."""
-        from src.domain.entities.line import Line
-        from src.domain.entities.arc import Arc
-        from src.domain.services.text_generator import TextEntity
-
+    def _get_entity_extents(
+        self, entity: Entity
+    ) -> tuple[float, float, float, float] | None:
+        """Get (min_x, min_y, max_x, max_y) of an entity without building a BoundingBox."""
         if isinstance(entity, Line):
-            return BoundingBox(
-                min_x=min(entity.start.x, entity.end.x),
-                min_y=min(entity.start.y, entity.end.y),
-                max_x=max(entity.start.x, entity.end.x),
-                max_y=max(entity.start.y, entity.end.y)
-            )
+            start, end = entity.start, entity.end
+            if start.x <= end.x:
+                min_x, max_x = start.x, end.x
+            else:
+                min_x, max_x = end.x, start.x
+            if start.y <= end.y:
+                min_y, max_y = start.y, end.y
+            else:
+                min_y, max_y = end.y, start.y
+            return (min_x, min_y, max_x, max_y)
         elif isinstance(entity, Arc):
             # Approximate arc bbox (not exact but sufficient for removal check)
-            return BoundingBox(
-                min_x=entity.center.x - entity.radius,
-                min_y=entity.center.y - entity.radius,
-                max_x=entity.center.x + entity.radius,
-                max_y=entity.center.y + entity.radius
+            center, radius = entity.center, entity.radius
+            return (
+                center.x - radius,
+                center.y - radius,
+                center.x + radius,
+                center.y + radius
             )
         elif isinstance(entity, TextEntity):
             # Text bbox (approximate based on position)
-            return BoundingBox(
-                min_x=entity.position.x,
-                min_y=entity.position.y,
-                max_x=entity.position.x + len(entity.content) * entity.height * 0.6,
-                max_y=entity.position.y + entity.height
+            position = entity.position
+            return (
+                position.x,
+                position.y,
+                position.x + len(entity.content) * entity.height * 0.6,
+                position.y + entity.height
             )
 
         return None
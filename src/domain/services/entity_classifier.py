@@ -3,13 +3,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace, field
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from src.domain.types import LineCategory, StandardColor
 
 if TYPE_CHECKING:
     from src.domain.entities.entity import Entity
 
+# ACI values run from 0 (BYBLOCK) to 256 (BYLAYER)
+_ACI_COLOR_COUNT = 257
+
+# Upper bound on memoized layer/color pairs per classifier
+_CATEGORY_CACHE_LIMIT = 1024
+
+# Layer names that carry no classification meaning
+_DEFAULT_LAYERS = frozenset({'0', ''})
+
+# Enum member bound once; LineCategory.UNKNOWN is a class attribute lookup
+# through the Enum metaclass on every access
+_UNKNOWN = LineCategory.UNKNOWN
+
 
 class UnclassifiedHandling(Enum):
     """Options for handling unclassified entities."""
@@ -21,7 +34,16 @@ class UnclassifiedHandling(Enum):
     SKIP = auto()               # Skip/exclude from output
 
 
-@dataclass
+# Category given to unclassified entities under each handling policy;
+# KEEP_UNKNOWN leaves them UNKNOWN and SKIP drops them before this applies
+_UNCLASSIFIED_CATEGORIES: dict[UnclassifiedHandling, LineCategory] = {
+    UnclassifiedHandling.TREAT_AS_CUT: LineCategory.CUT,
+    UnclassifiedHandling.TREAT_AS_CREASE: LineCategory.CREASE,
+    UnclassifiedHandling.TREAT_AS_AUXILIARY: LineCategory.AUXILIARY,
+}
+
+
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of entity classification with statistics."""
 
@@ -48,6 +70,31 @@ class EntityClassifier:
     # How to handle unclassified entities
     unclassified_handling: UnclassifiedHandling = UnclassifiedHandling.TREAT_AS_CUT
 
+    # Upper-cased (keyword, category) pairs from LAYER_PATTERNS in priority
+    # order, rebuilt whenever the patterns change (replaced or edited in place)
+    _layer_keywords: tuple[tuple[str, LineCategory], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _layer_patterns_copy: dict[LineCategory, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # COLOR_MAP as a table indexed by ACI value, rebuilt whenever the mapping
+    # changes (replaced or edited in place)
+    _color_lut: tuple[LineCategory, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _color_map_copy: dict[int, LineCategory] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Categories memoized by (layer, color); drawings reuse a few pairs for
+    # thousands of entities. Cleared whenever the keyword tuple or color
+    # table is rebuilt
+    _category_cache: dict[tuple[str, int | None], LineCategory] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Initialize default patterns and mappings."""
         if self.LAYER_PATTERNS is None:
@@ -78,21 +125,56 @@ class EntityClassifier:
         Returns:
             LineCategory for the entity
         """
+        self._sync_tables()
+        return self._cached_category(
+            (getattr(entity, 'layer', '0'), getattr(entity, 'color', None))
+        )
+
+    def _sync_tables(self) -> None:
+        """Rebuild the derived tables if either mapping changed since last call."""
+        # Public entry points call this once, so the memo lookups below stay
+        # check-free; a rebuild also drops the memoized categories
+        if self.LAYER_PATTERNS != self._layer_patterns_copy:
+            self._get_layer_keywords()
+        if self.COLOR_MAP != self._color_map_copy:
+            self._get_color_lut()
+
+    def _cached_category(self, key: tuple[str, int | None]) -> LineCategory:
+        """Classify a (layer, color) pair, computing each pair only once."""
+        cache = self._category_cache
+        category = cache.get(key)
+        if category is not None:
+            return category
+        if len(cache) >= _CATEGORY_CACHE_LIMIT:
+            cache.clear()
+
+        category = cache[key] = self._classify_attributes(*key)
+        return category
+
+    def _classify_attributes(self, layer: str, color: int | None) -> LineCategory:
+        """
+        Classify by a layer name and color pair.
+
+        Args:
+            layer: Layer name of the entity
+            color: ACI color of the entity, or None if it has none
+
+        Returns:
+            LineCategory for the pair
+        """
         # First try to classify by layer name
-        layer = getattr(entity, 'layer', '0')
-        if layer and layer not in ('0', ''):
+        if layer and layer not in _DEFAULT_LAYERS:
             category = self._classify_by_layer(layer)
-            if category != LineCategory.UNKNOWN:
+            if category is not _UNKNOWN:
                 return category
 
         # Fall back to color classification
-        color = getattr(entity, 'color', None)
         if color is not None:
             category = self._classify_by_color(color)
-            if category != LineCategory.UNKNOWN:
+            if category is not _UNKNOWN:
                 return category
 
-        return LineCategory.UNKNOWN
+        return _UNKNOWN
 
     def _classify_by_layer(self, layer_name: str) -> LineCategory:
         """
@@ -106,12 +188,29 @@ class EntityClassifier:
         """
         layer_upper = layer_name.upper()
 
-        for category, patterns in self.LAYER_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.upper() in layer_upper:
-                    return category
+        for keyword, category in self._get_layer_keywords():
+            if keyword in layer_upper:
+                return category
+
+        return _UNKNOWN
 
-        return LineCategory.UNKNOWN
+    def _get_layer_keywords(self) -> tuple[tuple[str, LineCategory], ...]:
+        """Get the layer patterns upper-cased and flattened once per content."""
+        # Compared against a copy, so patterns edited in place are picked up
+        # too; dict and list equality run in C and cost far less than a rebuild
+        if self.LAYER_PATTERNS != self._layer_patterns_copy:
+            patterns_copy = {
+                category: list(patterns)
+                for category, patterns in self.LAYER_PATTERNS.items()
+            }
+            self._layer_keywords = tuple(
+                (pattern.upper(), category)
+                for category, patterns in patterns_copy.items()
+                for pattern in patterns
+            )
+            self._layer_patterns_copy = patterns_copy
+            self._category_cache.clear()
+        return self._layer_keywords
 
     def _classify_by_color(self, color: int) -> LineCategory:
         """
@@ -123,7 +222,50 @@ class EntityClassifier:
         Returns:
             LineCategory or UNKNOWN if no match
         """
-        return self.COLOR_MAP.get(color, LineCategory.UNKNOWN)
+        lut = self._get_color_lut()
+        if isinstance(color, int) and 0 <= color < _ACI_COLOR_COUNT:
+            return lut[color]
+        return self.COLOR_MAP.get(color, _UNKNOWN)
+
+    def _get_color_lut(self) -> tuple[LineCategory, ...]:
+        """Get COLOR_MAP expanded into a lookup table over all ACI values."""
+        # Compared against a copy, so colors remapped in place are picked up
+        # too without rebuilding a snapshot on every call
+        if self.COLOR_MAP != self._color_map_copy:
+            color_map = dict(self.COLOR_MAP)
+            self._color_lut = tuple(
+                color_map.get(color, _UNKNOWN)
+                for color in range(_ACI_COLOR_COUNT)
+            )
+            self._color_map_copy = color_map
+            self._category_cache.clear()
+        return self._color_lut
+
+    def classify_batch(self, entities: list[Entity]) -> list[LineCategory]:
+        """
+        Classify a batch of entities in order.
+
+        Drawings use only a handful of layer/color combinations, so each
+        distinct pair is classified once and reused for the rest of the batch.
+
+        Args:
+            entities: List of entities to classify
+
+        Returns:
+            Category of each entity, in the same order
+        """
+        self._sync_tables()
+        known: dict[tuple[str, int | None], LineCategory] = {}
+        categories: list[LineCategory] = []
+
+        for entity in entities:
+            key = (getattr(entity, 'layer', '0'), getattr(entity, 'color', None))
+            category = known.get(key)
+            if category is None:
+                category = known[key] = self._cached_category(key)
+            categories.append(category)
+
+        return categories
 
     def classify_all(
         self, entities: list[Entity]
@@ -141,9 +283,17 @@ class EntityClassifier:
             category: [] for category in LineCategory
         }
 
+        self._sync_tables()
+
+        # Single pass: each layer/color pair resolves straight to the bound
+        # append of its category list, so no per-entity category is kept
+        appenders: dict[tuple[str, int | None], Callable[[Entity], None]] = {}
         for entity in entities:
-            category = self.classify(entity)
-            result[category].append(entity)
+            key = (getattr(entity, 'layer', '0'), getattr(entity, 'color', None))
+            append = appenders.get(key)
+            if append is None:
+                append = appenders[key] = result[self._cached_category(key)].append
+            append(entity)
 
         return result
 
@@ -170,7 +320,10 @@ class EntityClassifier:
         Returns:
             List of entities with categories applied
         """
-        return [self.apply_category(entity) for entity in entities]
+        return [
+            replace(entity, category=category)
+            for entity, category in zip(entities, self.classify_batch(entities))
+        ]
 
     def apply_categories_with_result(
         self, entities: list[Entity]
@@ -190,25 +343,20 @@ class EntityClassifier:
         statistics: dict[LineCategory, int] = {cat: 0 for cat in LineCategory}
         unclassified_count = 0
 
-        for entity in entities:
-            category = self.classify(entity)
+        # Resolve the unclassified handling policy once for the whole batch
+        skip_unknown = self.unclassified_handling == UnclassifiedHandling.SKIP
+        unknown_replacement = _UNCLASSIFIED_CATEGORIES.get(
+            self.unclassified_handling, _UNKNOWN
+        )
 
-            if category == LineCategory.UNKNOWN:
+        for entity, category in zip(entities, self.classify_batch(entities)):
+            if category is _UNKNOWN:
                 unclassified_count += 1
-
-                # Apply unclassified handling policy
-                if self.unclassified_handling == UnclassifiedHandling.SKIP:
+                if skip_unknown:
                     continue
-                elif self.unclassified_handling == UnclassifiedHandling.TREAT_AS_CUT:
-                    category = LineCategory.CUT
-                elif self.unclassified_handling == UnclassifiedHandling.TREAT_AS_CREASE:
-                    category = LineCategory.CREASE
-                elif self.unclassified_handling == UnclassifiedHandling.TREAT_AS_AUXILIARY:
-                    category = LineCategory.AUXILIARY
-                # KEEP_UNKNOWN: category stays as UNKNOWN
-
-            updated_entity = replace(entity, category=category)
-            result_entities.append(updated_entity)
+                category = unknown_replacement
+
+            result_entities.append(replace(entity, category=category))
             statistics[category] += 1
 
         return ClassificationResult(
@@ -227,10 +375,7 @@ class EntityClassifier:
         Returns:
             Number of entities that would be UNKNOWN
         """
-        return sum(
-            1 for entity in entities
-            if self.classify(entity) == LineCategory.UNKNOWN
-        )
+        return self.classify_batch(entities).count(_UNKNOWN)
 
     def get_unclassified_entities(self, entities: list[Entity]) -> list[Entity]:
         """
@@ -243,6 +388,7 @@ class EntityClassifier:
             List of unclassified entities
         """
         return [
-            entity for entity in entities
-            if self.classify(entity) == LineCategory.UNKNOWN
+            entity
+            for entity, category in zip(entities, self.classify_batch(entities))
+            if category is _UNKNOWN
         ]
@@ -35,13 +35,32 @@ class GeometryService:
         if not entities:
             return None
 
-        boxes = [entity.bounding_box for entity in entities]
-        result = boxes[0]
+        min_x, min_y, max_x, max_y = self._extents(entities)
+        return BoundingBox(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
 
-        for box in boxes[1:]:
-            result = result.union(box)
-
-        return result
+    def _extents(
+        self, entities: list[Entity]
+    ) -> tuple[float, float, float, float]:
+        """Get (min_x, min_y, max_x, max_y) of a non-empty entity list."""
+        # Collect extents as flat coordinate lists and reduce them once; lines
+        # contribute their endpoints directly instead of a BoundingBox each
+        xs: list[float] = []
+        ys: list[float] = []
+        for entity in entities:
+            if isinstance(entity, Line):
+                start, end = entity.start, entity.end
+                xs.append(start.x)
+                xs.append(end.x)
+                ys.append(start.y)
+                ys.append(end.y)
+            else:
+                box = entity.bounding_box
+                xs.append(box.min_x)
+                xs.append(box.max_x)
+                ys.append(box.min_y)
+                ys.append(box.max_y)
+
+        return min(xs), min(ys), max(xs), max(ys)
 
     def mirror_x(self, entity: T, center_x: float) -> T:
         """
@@ -66,9 +85,11 @@ class GeometryService:
 
     def _mirror_line_x(self, line: Line, center_x: float) -> Line:
         """Mirror a line across vertical axis."""
-        new_start = line.start.mirror_x(center_x)
-        new_end = line.end.mirror_x(center_x)
-        return replace(line, start=new_start, end=new_end)
+        # Same result as dataclasses.replace, which keeps the id, without
+        # going through the generated __init__
+        return Line._unchecked(
+            line.start.mirror_x(center_x), line.end.mirror_x(center_x), line, line.id
+        )
 
     def _mirror_arc_x(self, arc: Arc, center_x: float) -> Arc:
         """Mirror an arc across vertical axis."""
@@ -121,9 +142,9 @@ class GeometryService:
 
     def _translate_line(self, line: Line, dx: float, dy: float) -> Line:
         """Translate a line by offset."""
-        new_start = line.start.translate(dx, dy)
-        new_end = line.end.translate(dx, dy)
-        return replace(line, start=new_start, end=new_end)
+        return Line._unchecked(
+            line.start.translate(dx, dy), line.end.translate(dx, dy), line, line.id
+        )
 
     def _translate_arc(self, arc: Arc, dx: float, dy: float) -> Arc:
         """Translate an arc by offset."""
@@ -144,7 +165,8 @@ class GeometryService:
         Returns:
             List of translated entities
         """
-        return [self.translate(entity, dx, dy) for entity in entities]
+        translate = self.translate
+        return [translate(entity, dx, dy) for entity in entities]
 
     def center_at(
         self, entities: list[Entity], target: Point
@@ -159,13 +181,13 @@ class GeometryService:
         Returns:
             List of centered entities
         """
-        bbox = self.calculate_bounding_box(entities)
-        if bbox is None:
+        if not entities:
             return entities
 
-        current_center = bbox.center
-        dx = target.x - current_center.x
-        dy = target.y - current_center.y
+        # Center straight from the extents, without a BoundingBox and Point
+        min_x, min_y, max_x, max_y = self._extents(entities)
+        dx = target.x - (min_x + max_x) / 2
+        dy = target.y - (min_y + max_y) / 2
 
         return self.translate_entities(entities, dx, dy)
 
@@ -180,4 +202,42 @@ class GeometryService:
         Returns:
             Distance between points
         """
+        # Coincident points are common (shared vertices, snapped endpoints)
+        if p1 is p2 or (p1.x == p2.x and p1.y == p2.y):
+            return 0.0
         return p1.distance_to(p2)
+
+    def distance_sq(self, p1: Point, p2: Point) -> float:
+        """
+        Calculate squared Euclidean distance between two points.
+
+        Cheaper than distance() when only comparing or ordering distances.
+
+        Args:
+            p1: First point
+            p2: Second point
+
+        Returns:
+            Squared distance between points
+        """
+        dx = p1.x - p2.x
+        dy = p1.y - p2.y
+        return dx * dx + dy * dy
+
+    def distance_within(self, p1: Point, p2: Point, max_distance: float) -> bool:
+        """
+        Check whether two points are at most max_distance apart.
+
+        Compares squared distances, so no square root is taken.
+
+        Args:
+            p1: First point
+            p2: Second point
+            max_distance: Maximum allowed distance
+
+        Returns:
+            True if the distance between the points is <= max_distance
+        """
+        dx = p1.x - p2.x
+        dy = p1.y - p2.y
+        return dx * dx + dy * dy <= max_distance * max_distance
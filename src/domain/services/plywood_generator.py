@@ -12,6 +12,9 @@ from src.domain.types import PlateType, StandardColor, LineCategory
 if TYPE_CHECKING:
     from src.domain.entities.entity import Entity
 
+# Corner index pairs of the rectangle edges: bottom, right, top, left
+_RECTANGLE_EDGES: tuple[tuple[int, int], ...] = ((0, 1), (1, 2), (2, 3), (3, 0))
+
 
 @dataclass(frozen=True, slots=True)
 class PlywoodSettings:
@@ -33,6 +36,11 @@ class PlywoodSettings:
         Returns:
             PlywoodSettings with appropriate margins
         """
+        # Settings are immutable, so the prebuilt instance can be shared
+        settings = _PLATE_SETTINGS.get(plate_type)
+        if settings is not None and cls is PlywoodSettings:
+            return settings
+
         if plate_type == PlateType.COPPER:
             return cls(bottom_margin=25.0)
         elif plate_type == PlateType.AUTO:
@@ -41,6 +49,13 @@ class PlywoodSettings:
             return cls()
 
 
+# Per-plate settings, built once at import through the factory's own branches
+_PLATE_SETTINGS: dict[PlateType, PlywoodSettings] = {}
+_PLATE_SETTINGS.update(
+    {plate_type: PlywoodSettings.for_plate_type(plate_type) for plate_type in PlateType}
+)
+
+
 @dataclass
 class PlywoodGenerator:
     """Service for generating plywood frame rectangles."""
@@ -55,31 +70,7 @@ class PlywoodGenerator:
         Returns:
             List of 4 lines forming the rectangle
         """
-        # Define corner points
-        bottom_left = Point(bbox.min_x, bbox.min_y)
-        bottom_right = Point(bbox.max_x, bbox.min_y)
-        top_right = Point(bbox.max_x, bbox.max_y)
-        top_left = Point(bbox.min_x, bbox.max_y)
-
-        # Create lines with plywood properties
-        line_props = {
-            'color': StandardColor.WHITE,
-            'layer': 'PLYWOOD',
-            'category': LineCategory.PLYWOOD,
-        }
-
-        lines = [
-            # Bottom edge
-            Line(start=bottom_left, end=bottom_right, **line_props),
-            # Right edge
-            Line(start=bottom_right, end=top_right, **line_props),
-            # Top edge
-            Line(start=top_right, end=top_left, **line_props),
-            # Left edge
-            Line(start=top_left, end=bottom_left, **line_props),
-        ]
-
-        return lines
+        return self._rectangle_lines(bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y)
 
     def apply_margins(
         self, bbox: BoundingBox, settings: PlywoodSettings
@@ -114,8 +105,14 @@ class PlywoodGenerator:
         Returns:
             List of lines forming the plywood frame
         """
-        expanded = self.apply_margins(bbox, settings)
-        return self.generate_rectangle(expanded)
+        # Margins are folded into the corner coordinates, skipping the
+        # intermediate expanded BoundingBox that apply_margins would build
+        return self._rectangle_lines(
+            bbox.min_x - settings.left_margin,
+            bbox.min_y - settings.bottom_margin,
+            bbox.max_x + settings.right_margin,
+            bbox.max_y + settings.top_margin,
+        )
 
     def generate_for_entities(
         self,
@@ -148,6 +145,60 @@ class PlywoodGenerator:
 
         return self.generate_with_margins(bbox, settings)
 
+    def generate_batch(
+        self,
+        entity_lists: list[list[Entity]],
+        settings: PlywoodSettings | None = None
+    ) -> list[list[Line]]:
+        """
+        Generate plywood frames for several drawings at once.
+
+        Args:
+            entity_lists: Entity lists, one per drawing
+            settings: Optional margin settings shared by all drawings
+
+        Returns:
+            One list of frame lines per drawing, empty for empty drawings
+        """
+        if settings is None:
+            settings = PlywoodSettings()
+
+        from src.domain.services.geometry_service import GeometryService
+        calculate_bounding_box = GeometryService().calculate_bounding_box
+        generate_with_margins = self.generate_with_margins
+
+        frames: list[list[Line]] = []
+        for entities in entity_lists:
+            bbox = calculate_bounding_box(entities)
+            frames.append(
+                [] if bbox is None else generate_with_margins(bbox, settings)
+            )
+        return frames
+
+    def _rectangle_lines(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> list[Line]:
+        """Build the four plywood lines of a rectangle from its extents."""
+        # Define corner points (bottom-left, bottom-right, top-right, top-left)
+        corners = (
+            Point(min_x, min_y),
+            Point(max_x, min_y),
+            Point(max_x, max_y),
+            Point(min_x, max_y),
+        )
+
+        # Create lines with plywood properties from the fixed edge template
+        return [
+            Line(
+                start=corners[start],
+                end=corners[end],
+                color=StandardColor.WHITE,
+                layer='PLYWOOD',
+                category=LineCategory.PLYWOOD,
+            )
+            for start, end in _RECTANGLE_EDGES
+        ]
+
     def calculate_drawing_position(
         self, drawing_bbox: BoundingBox, settings: PlywoodSettings
     ) -> Point:
@@ -5,7 +5,6 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from src.domain.entities.line import Line
-from src.domain.entities.arc import Arc
 from src.domain.entities.polyline import Polyline
 from src.domain.entities.entity import Entity
 from src.domain.services.bridge_calculator import BridgeCalculator
@@ -16,7 +15,7 @@ if TYPE_CHECKING:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PolylineProcessingResult:
     """Result of polyline processing."""
 
@@ -71,6 +70,15 @@ class PolylineBridgeProcessor:
         decomposed_segment_count = 0
         bridged_segment_count = 0
 
+        # One calculator per settings so bridge gaps are shared across segments;
+        # without bridges no category has a calculator
+        calculators: dict[LineCategory, BridgeCalculator] = {}
+        if apply_bridges:
+            calculators[LineCategory.CUT] = BridgeCalculator(self.cut_bridge_settings)
+            calculators[LineCategory.CREASE] = BridgeCalculator(
+                self.crease_bridge_settings
+            )
+
         for entity in entities:
             if isinstance(entity, Polyline):
                 original_polyline_count += 1
@@ -79,15 +87,24 @@ class PolylineBridgeProcessor:
                 segments = entity.decompose()
                 decomposed_segment_count += len(segments)
 
-                if apply_bridges:
-                    # Apply bridges to each segment
-                    for segment in segments:
-                        bridged = self._apply_bridges_to_segment(segment)
-                        processed.extend(bridged)
-                        if len(bridged) > 1:
-                            bridged_segment_count += 1
-                else:
+                # Segments inherit the polyline's category, so the bridge
+                # calculator is resolved once per polyline
+                calculator = self._get_calculator(entity.category, calculators)
+                if calculator is None:
                     processed.extend(segments)
+                    continue
+
+                # Apply bridges to each line segment
+                # Arc bridge support could be added later
+                apply = calculator.apply_bridges
+                for segment in segments:
+                    if not isinstance(segment, Line):
+                        processed.append(segment)
+                        continue
+                    bridged = apply(segment)
+                    processed.extend(bridged)
+                    if len(bridged) > 1:
+                        bridged_segment_count += 1
             else:
                 # Non-polyline entities pass through unchanged
                 processed.append(entity)
@@ -112,36 +129,26 @@ class PolylineBridgeProcessor:
         result = self.process(entities, apply_bridges=False)
         return result.processed_entities
 
-    def _apply_bridges_to_segment(self, segment: Line | Arc) -> list[Line | Arc]:
+    def _get_calculator(
+        self,
+        category: LineCategory,
+        calculators: dict[LineCategory, BridgeCalculator]
+    ) -> BridgeCalculator | None:
         """
-        Apply bridges to a single segment.
+        Get the bridge calculator for a segment category.
 
         Args:
-            segment: Line or Arc segment
+            category: Category of the segments
+            calculators: Bridge calculators for CUT and CREASE categories
 
         Returns:
-            List of segments (split by bridges)
+            Matching calculator, or None if the category gets no bridges
         """
-        # Only apply bridges to lines for now
-        # Arc bridge support could be added later
-        if not isinstance(segment, Line):
-            return [segment]
-
-        # Determine which bridge settings to use based on category
-        category = getattr(segment, 'category', LineCategory.UNKNOWN)
-
-        if category == LineCategory.CUT:
-            settings = self.cut_bridge_settings
-        elif category == LineCategory.CREASE:
-            settings = self.crease_bridge_settings
-        elif category == LineCategory.UNKNOWN and self.process_unknown_as_cut:
-            settings = self.cut_bridge_settings
-        else:
-            # No bridges for auxiliary, plywood, or other categories
-            return [segment]
-
-        calculator = BridgeCalculator(settings)
-        return calculator.apply_bridges(segment)
+        if category == LineCategory.UNKNOWN and self.process_unknown_as_cut:
+            category = LineCategory.CUT
+
+        # No bridges for auxiliary, plywood, or other categories
+        return calculators.get(category)
 
     def get_polyline_count(self, entities: list[Entity]) -> int:
         """
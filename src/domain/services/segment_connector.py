@@ -1,6 +1,7 @@
 """Service for connecting arc segments."""
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -69,30 +70,97 @@ class SegmentConnector:
         Returns:
             List of ConnectionCandidate objects
         """
-        candidates = []
-
-        for i, entity_a in enumerate(entities):
-            endpoints_a = self._get_endpoints(entity_a)
+        candidates: list[ConnectionCandidate] = []
+
+        # Endpoints are computed once per entity, not once per pair; arcs
+        # derive theirs with trigonometry on every access
+        endpoints = [self._get_endpoints(entity) for entity in entities]
+        # Constraint keys are likewise read (and uppercased) once per entity
+        keys = [self._connection_key(entity) for entity in entities]
+        count = len(entities)
+        tolerance = self.tolerance
+        hypot = math.hypot
+
+        # Candidates need 0 < distance <= tolerance, impossible without
+        # a positive tolerance; written so a NaN tolerance returns here too
+        if not tolerance > 0:
+            return candidates
+
+        # Bucket endpoints on a uniform grid; cells are twice the tolerance
+        # wide, so any endpoint within tolerance of another lies in one of
+        # the 3x3 cells around it, even with rounding at cell borders
+        cell_size = 2 * tolerance
+        floor = math.floor
+        isfinite = math.isfinite
+        grid: dict[tuple[int, int], list[int]] = {}
+        cells: list[list[tuple[int, int]]] = []
+        bucketed = True
+        for index, points in enumerate(endpoints):
+            entity_cells = []
+            for point in points:
+                # Non-finite coordinates are never within tolerance of anything
+                if not (isfinite(point.x) and isfinite(point.y)):
+                    continue
+                grid_x = point.x / cell_size
+                grid_y = point.y / cell_size
+                # A tiny tolerance or huge coordinates overflow the cell
+                # index; those drawings fall back to the full pairwise scan
+                if not (isfinite(grid_x) and isfinite(grid_y)):
+                    bucketed = False
+                    break
+                cell = (floor(grid_x), floor(grid_y))
+                entity_cells.append(cell)
+                grid.setdefault(cell, []).append(index)
+            if not bucketed:
+                break
+            cells.append(entity_cells)
+
+        for i in range(count):
+            endpoints_a = endpoints[i]
             if not endpoints_a:
                 continue
+            entity_a = entities[i]
+            layer_a, color_a = keys[i]
+
+            # Only later entities sharing a neighbouring cell can produce a
+            # candidate; visiting them in index order keeps the result in
+            # the same order as a full pairwise scan
+            if bucketed:
+                neighbours: set[int] = set()
+                for cell_x, cell_y in cells[i]:
+                    for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+                        for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+                            bucket = grid.get((grid_x, grid_y))
+                            if bucket is not None:
+                                neighbours.update(bucket)
+                later = sorted(index for index in neighbours if index > i)
+            else:
+                later = range(i + 1, count)
 
-            for j, entity_b in enumerate(entities):
-                if j <= i:
-                    continue
+            for j in later:
+                endpoints_b = endpoints[j]
+                entity_b = entities[j]
 
-                # Check constraints
-                if not self._can_connect(entity_a, entity_b):
+                # Check constraints; same rule as _can_connect, on the keys
+                layer_b, color_b = keys[j]
+                if layer_a is not None and layer_b is not None and layer_a != layer_b:
                     continue
-
-                endpoints_b = self._get_endpoints(entity_b)
-                if not endpoints_b:
+                if color_a is not None and color_b is not None and color_a != color_b:
                     continue
 
-                # Check all endpoint combinations
+                # Check all endpoint combinations; same formula as
+                # _calculate_distance, inlined for the pair loop. A pair of
+                # neighbours usually has only one close combination, so the
+                # rest are rejected on a single axis before the hypot; the
+                # hypot is never below either axis offset, so this is exact
                 for point_a in endpoints_a:
+                    ax, ay = point_a.x, point_a.y
                     for point_b in endpoints_b:
-                        distance = self._calculate_distance(point_a, point_b)
-                        if 0 < distance <= self.tolerance:
+                        dx = point_b.x - ax
+                        if dx > tolerance or dx < -tolerance:
+                            continue
+                        distance = hypot(dx, point_b.y - ay)
+                        if 0 < distance <= tolerance:
                             candidates.append(ConnectionCandidate(
                                 entity_a=entity_a,
                                 entity_b=entity_b,
@@ -128,27 +196,26 @@ class SegmentConnector:
                 unconnected_entities=[]
             )
 
-        # Track which entities have been modified
-        modified = set()
-        entity_map = {id(e): e for e in entities}
+        # Each entity takes part in at most one connection, so this is a
+        # single greedy pass over the candidates (no repeated rescans);
+        # entities are tracked by identity as they need not be hashable
+        modified: set[int] = set()
         result_entities = []
         connection_count = 0
 
         # Process each connection candidate
         for candidate in candidates:
-            id_a = id(candidate.entity_a)
-            id_b = id(candidate.entity_b)
+            entity_a = candidate.entity_a
+            entity_b = candidate.entity_b
+            id_a = id(entity_a)
+            id_b = id(entity_b)
 
             # Skip if either entity was already modified
             if id_a in modified or id_b in modified:
                 continue
 
             # Try to connect the entities
-            connected = self._connect_pair(
-                entity_map.get(id_a, candidate.entity_a),
-                entity_map.get(id_b, candidate.entity_b),
-                candidate
-            )
+            connected = self._connect_pair(entity_a, entity_b, candidate)
 
             if connected:
                 modified.add(id_a)
@@ -157,9 +224,9 @@ class SegmentConnector:
                 connection_count += 1
 
         # Add unmodified entities
-        for entity in entities:
-            if id(entity) not in modified:
-                result_entities.append(entity)
+        result_entities.extend(
+            entity for entity in entities if id(entity) not in modified
+        )
 
         return ConnectionResult(
             connected_entities=result_entities,
@@ -206,26 +273,39 @@ class SegmentConnector:
 
     def _calculate_distance(self, p1: Point, p2: Point) -> float:
         """Calculate distance between two points."""
-        return ((p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2) ** 0.5
+        return math.hypot(p2.x - p1.x, p2.y - p1.y)
 
     def _can_connect(self, entity_a: Entity, entity_b: Entity) -> bool:
         """Check if two entities can be connected based on constraints."""
+        layer_a, color_a = self._connection_key(entity_a)
+        layer_b, color_b = self._connection_key(entity_b)
+
         # Check layer constraint
-        if self.same_layer_only:
-            layer_a = getattr(entity_a, 'layer', None)
-            layer_b = getattr(entity_b, 'layer', None)
-            if layer_a and layer_b and layer_a.upper() != layer_b.upper():
-                return False
+        if layer_a is not None and layer_b is not None and layer_a != layer_b:
+            return False
 
         # Check color constraint
-        if self.same_color_only:
-            color_a = getattr(entity_a, 'color', None)
-            color_b = getattr(entity_b, 'color', None)
-            if color_a is not None and color_b is not None and color_a != color_b:
-                return False
+        if color_a is not None and color_b is not None and color_a != color_b:
+            return False
 
         return True
 
+    def _connection_key(self, entity: Entity) -> tuple[str | None, object]:
+        """
+        Get the values an entity is matched on when connecting.
+
+        Returns:
+            Tuple of (uppercased layer, color); each is None when its
+            constraint is off or the entity has no usable value
+        """
+        layer = None
+        if self.same_layer_only:
+            layer = getattr(entity, 'layer', None)
+            layer = layer.upper() if layer else None
+
+        color = getattr(entity, 'color', None) if self.same_color_only else None
+        return layer, color
+
     def _connect_pair(
         self,
         entity_a: Entity,
@@ -255,28 +335,28 @@ class SegmentConnector:
     def _are_collinear(self, line_a: Line, line_b: Line, tolerance: float = 0.01) -> bool:
         """Check if two lines are collinear (on the same infinite line)."""
         # For two lines to be collinear, all four points must be on the same line
+        start_a, end_a = line_a.start, line_a.end
+        ax, ay = start_a.x, start_a.y
 
         # Calculate direction vectors
-        dx_a = line_a.end.x - line_a.start.x
-        dy_a = line_a.end.y - line_a.start.y
+        dx_a = end_a.x - ax
+        dy_a = end_a.y - ay
 
-        # Check if line_b's start point is on line_a's infinite line
-        # Using cross product: if cross product is zero, points are collinear
-        dx_b = line_b.start.x - line_a.start.x
-        dy_b = line_b.start.y - line_a.start.y
-        cross_start = abs(dx_a * dy_b - dy_a * dx_b)
-
-        dx_b = line_b.end.x - line_a.start.x
-        dy_b = line_b.end.y - line_a.start.y
-        cross_end = abs(dx_a * dy_b - dy_a * dx_b)
-
-        line_length = (dx_a ** 2 + dy_a ** 2) ** 0.5
+        # Degenerate lines have no direction to compare against
+        line_length = math.hypot(dx_a, dy_a)
         if line_length < tolerance:
             return False
 
+        # Check if line_b's endpoints are on line_a's infinite line
+        # Using cross product: if cross product is zero, points are collinear
+        start_b, end_b = line_b.start, line_b.end
+        cross_start = abs(dx_a * (start_b.y - ay) - dy_a * (start_b.x - ax))
+        if not cross_start / line_length < tolerance:
+            return False
+        cross_end = abs(dx_a * (end_b.y - ay) - dy_a * (end_b.x - ax))
+
         # Normalize by line length for tolerance check
-        return (cross_start / line_length < tolerance and
-                cross_end / line_length < tolerance)
+        return cross_end / line_length < tolerance
 
     def _merge_lines(self, line_a: Line, line_b: Line) -> Line:
         """Merge two collinear lines into one."""
@@ -62,26 +62,30 @@ class StraightKnifeGenerator:
             center_y = (drawing_bbox.min_y + drawing_bbox.max_y) / 2
             y_positions = [center_y]
 
-        knives = []
+        # The knife spans and the bridge gaps do not depend on Y, so they are
+        # worked out once and every Y reuses them; a single calculator keeps
+        # its gap cache across all knives
+        spans = [
+            # Left knife (from plywood left edge to drawing left edge)
+            (plywood_bbox.min_x, drawing_bbox.min_x),
+            # Right knife (from drawing right edge to plywood right edge)
+            (drawing_bbox.max_x, plywood_bbox.max_x),
+        ]
+        # Skip spans whose start and end are same or very close
+        spans = [
+            (min(start_x, end_x), max(start_x, end_x))
+            for start_x, end_x in spans
+            if abs(end_x - start_x) >= 1.0
+        ]
+        calculator = (
+            BridgeCalculator(settings.bridge_settings)
+            if settings.apply_bridges else None
+        )
 
+        knives: list[Line] = []
         for y in y_positions:
-            # Generate left knife (from plywood left edge to drawing left edge)
-            left_knives = self._generate_knife(
-                start_x=plywood_bbox.min_x,
-                end_x=drawing_bbox.min_x,
-                y=y,
-                settings=settings
-            )
-            knives.extend(left_knives)
-
-            # Generate right knife (from drawing right edge to plywood right edge)
-            right_knives = self._generate_knife(
-                start_x=drawing_bbox.max_x,
-                end_x=plywood_bbox.max_x,
-                y=y,
-                settings=settings
-            )
-            knives.extend(right_knives)
+            for min_x, max_x in spans:
+                knives.extend(self._generate_knife(min_x, max_x, y, settings, calculator))
 
         return knives
 
@@ -123,74 +127,72 @@ class StraightKnifeGenerator:
         Returns:
             List of Y positions where horizontal lines exist
         """
-        from src.domain.entities.line import Line
-
-        # Collect Y positions of horizontal lines
-        y_positions = []
-
-        for entity in entities:
-            if isinstance(entity, Line):
-                # Check if line is horizontal (same Y for start and end)
-                if abs(entity.start.y - entity.end.y) < tolerance:
-                    y_positions.append(entity.start.y)
+        # Collect Y positions of horizontal lines (same Y for start and end)
+        # in one pass over the entities
+        y_positions = [
+            entity.start.y
+            for entity in entities
+            if isinstance(entity, Line)
+            and abs(entity.start.y - entity.end.y) < tolerance
+        ]
 
         # Cluster similar Y positions
         if not y_positions:
             return []
 
+        # Clusters are contiguous runs of the sorted positions, so they are
+        # averaged from slices instead of being copied into lists one by one
         y_positions.sort()
         clusters = []
-        current_cluster = [y_positions[0]]
-
-        for y in y_positions[1:]:
-            if y - current_cluster[-1] <= tolerance:
-                current_cluster.append(y)
-            else:
-                clusters.append(sum(current_cluster) / len(current_cluster))
-                current_cluster = [y]
-
-        if current_cluster:
-            clusters.append(sum(current_cluster) / len(current_cluster))
+        cluster_start = 0
+        previous = y_positions[0]
+
+        for index in range(1, len(y_positions)):
+            y = y_positions[index]
+            if y - previous > tolerance:
+                clusters.append(
+                    sum(y_positions[cluster_start:index]) / (index - cluster_start)
+                )
+                cluster_start = index
+            previous = y
+
+        clusters.append(
+            sum(y_positions[cluster_start:]) / (len(y_positions) - cluster_start)
+        )
 
         return clusters
 
     def _generate_knife(
         self,
-        start_x: float,
-        end_x: float,
+        min_x: float,
+        max_x: float,
         y: float,
-        settings: StraightKnifeSettings
+        settings: StraightKnifeSettings,
+        calculator: BridgeCalculator | None
     ) -> list[Line]:
         """
         Generate a single knife line (possibly split by bridges).
 
         Args:
-            start_x: Starting X coordinate
-            end_x: Ending X coordinate
+            min_x: Left X coordinate
+            max_x: Right X coordinate
             y: Y coordinate
             settings: Knife settings
+            calculator: Bridge calculator, or None to leave the knife whole
 
         Returns:
             List of Line segments (split by bridges if applicable)
         """
-        # Skip if start and end are same or very close
-        length = abs(end_x - start_x)
-        if length < 1.0:
-            return []
-
         base_line = Line(
-            start=Point(min(start_x, end_x), y),
-            end=Point(max(start_x, end_x), y),
+            start=Point(min_x, y),
+            end=Point(max_x, y),
             color=settings.color,
             layer=settings.layer,
             category=LineCategory.CUT
         )
 
-        if not settings.apply_bridges:
+        if calculator is None:
             return [base_line]
 
-        # Create bridge calculator with settings
-        calculator = BridgeCalculator(settings.bridge_settings)
-
         # Apply bridges to the line
         return calculator.apply_bridges(base_line)
@@ -12,6 +12,11 @@ from src.domain.types import Side, PlateType, StandardColor
 if TYPE_CHECKING:
     pass
 
+# Display text per side and plate type; anything else falls back to the
+# back-side / auto-plate wording
+_SIDE_TEXT = {Side.FRONT: "앞"}
+_PLATE_TEXT = {PlateType.COPPER: "동판"}
+
 
 @dataclass(frozen=True, slots=True)
 class JobInfo:
@@ -31,18 +36,12 @@ class JobInfo:
     @property
     def side_text(self) -> str:
         """Get side as display text."""
-        if self.side == Side.FRONT:
-            return "앞"
-        else:
-            return "뒤"
+        return _SIDE_TEXT.get(self.side, "뒤")
 
     @property
     def plate_text(self) -> str:
         """Get plate type as display text."""
-        if self.plate_type == PlateType.COPPER:
-            return "동판"
-        else:
-            return "자동"
+        return _PLATE_TEXT.get(self.plate_type, "자동")
 
 
 @dataclass(frozen=True, slots=True)
@@ -97,13 +96,8 @@ class TextGenerator:
         Returns:
             TextEntity for side marker
         """
-        if side == Side.FRONT:
-            content = "앞"
-        else:
-            content = "뒤"
-
         return TextEntity(
-            content=content,
+            content=_SIDE_TEXT.get(side, "뒤"),
             position=Point(0, 0),  # Will be repositioned
             height=self.text_height * 2  # Larger for visibility
         )
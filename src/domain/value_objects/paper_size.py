@@ -4,6 +4,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import ClassVar
 
+# Upper bound on memoized rotations of custom sizes
+_ROTATION_CACHE_LIMIT = 256
+
 
 @dataclass(frozen=True, slots=True)
 class PaperSize:
@@ -65,6 +68,11 @@ class PaperSize:
         Raises:
             ValueError: If name is not a known standard size
         """
+        # Instances are immutable, so the prebuilt one can be shared
+        paper = _STANDARD_PAPER_SIZES.get(name)
+        if paper is not None and cls is PaperSize:
+            return paper
+
         if name not in cls.STANDARD_SIZES:
             raise ValueError(f"Unknown standard size: {name}")
         width, height = cls.STANDARD_SIZES[name]
@@ -107,11 +115,18 @@ class PaperSize:
 
     def rotate(self) -> PaperSize:
         """Return rotated paper size (swap width and height)."""
-        return PaperSize(
-            name=f"{self.name} (회전)",
-            width=self.height,
-            height=self.width
-        )
+        # Equal sizes rotate to equal sizes, so the validated result is shared
+        rotated = _ROTATED_PAPER_SIZES.get(self)
+        if rotated is None:
+            rotated = PaperSize(
+                name=f"{self.name} (회전)",
+                width=self.height,
+                height=self.width
+            )
+            if len(_ROTATED_PAPER_SIZES) >= _ROTATION_CACHE_LIMIT:
+                _ROTATED_PAPER_SIZES.clear()
+            _ROTATED_PAPER_SIZES[self] = rotated
+        return rotated
 
     def fits_drawing(self, drawing_width: float, drawing_height: float) -> bool:
         """
@@ -125,3 +140,13 @@ class PaperSize:
             True if drawing fits within paper
         """
         return drawing_width <= self.width and drawing_height <= self.height
+
+
+# Standard sizes built and validated once at import
+_STANDARD_PAPER_SIZES: dict[str, PaperSize] = {
+    name: PaperSize(name=name, width=width, height=height)
+    for name, (width, height) in PaperSize.STANDARD_SIZES.items()
+}
+
+# Rotations already computed, keyed by the (hashable) source size
+_ROTATED_PAPER_SIZES: dict[PaperSize, PaperSize] = {}
@@ -4,7 +4,7 @@ ezdxf adapter for DXF file operations.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import ezdxf
 from ezdxf.entities import (
@@ -49,6 +49,30 @@ class EzdxfReader(IDxfReader):
         except Exception as e:
             raise DxfParseError(f"Failed to parse DXF file: {e}") from e
 
+        return self._convert_document(doc)
+
+    def read_stream(self, stream: TextIO) -> list[Entity]:
+        """
+        Read entities from DXF text held in a stream.
+
+        Args:
+            stream: Text stream positioned at the start of the DXF data
+
+        Returns:
+            List of domain entities parsed from the stream
+
+        Raises:
+            DxfParseError: If the stream cannot be parsed
+        """
+        try:
+            doc = ezdxf.read(stream)
+        except Exception as e:
+            raise DxfParseError(f"Failed to parse DXF stream: {e}") from e
+
+        return self._convert_document(doc)
+
+    def _convert_document(self, doc: Any) -> list[Entity]:
+        """Convert the modelspace of an ezdxf document to domain entities."""
         entities: list[Entity] = []
         msp = doc.modelspace()
 
@@ -201,22 +225,8 @@ class EzdxfWriter(IDxfWriter):
         Raises:
             DxfWriteError: If the file cannot be written
         """
-        # Convert version code to ezdxf format
-        ezdxf_version = self.VERSION_MAP.get(version, 'R2010')
-
         try:
-            doc = ezdxf.new(ezdxf_version)
-            msp = doc.modelspace()
-
-            # Ensure layers exist
-            layers_used = {e.layer for e in entities if hasattr(e, 'layer')}
-            for layer_name in layers_used:
-                if layer_name not in doc.layers:
-                    doc.layers.add(layer_name)
-
-            # Add entities
-            for entity in entities:
-                self._add_entity(msp, entity)
+            doc = self._build_document(entities, version)
 
             # Save file
             doc.saveas(str(file_path))
@@ -224,6 +234,59 @@ class EzdxfWriter(IDxfWriter):
         except Exception as e:
             raise DxfWriteError(f"Failed to write DXF file: {e}") from e
 
+    def write_stream(
+        self,
+        entities: list[Entity],
+        stream: TextIO,
+        version: str = "AC1024"
+    ) -> None:
+        """
+        Write entities as DXF text to a stream.
+
+        Args:
+            entities: List of domain entities to write
+            stream: Text stream to write the DXF data to
+            version: DXF version string (default: AC1024 = AutoCAD 2010)
+
+        Raises:
+            DxfWriteError: If the data cannot be written
+        """
+        try:
+            doc = self._build_document(entities, version)
+            doc.write(stream)
+
+        except Exception as e:
+            raise DxfWriteError(f"Failed to write DXF stream: {e}") from e
+
+    def _build_document(self, entities: list[Entity], version: str) -> Any:
+        """
+        Create an ezdxf document containing the given entities.
+
+        Args:
+            entities: List of domain entities to add
+            version: DXF version string
+
+        Returns:
+            New ezdxf document
+        """
+        # Convert version code to ezdxf format
+        ezdxf_version = self.VERSION_MAP.get(version, 'R2010')
+
+        doc = ezdxf.new(ezdxf_version)
+        msp = doc.modelspace()
+
+        # Ensure layers exist
+        layers_used = {e.layer for e in entities if hasattr(e, 'layer')}
+        for layer_name in layers_used:
+            if layer_name not in doc.layers:
+                doc.layers.add(layer_name)
+
+        # Add entities
+        for entity in entities:
+            self._add_entity(msp, entity)
+
+        return doc
+
     def _add_entity(self, msp: Any, entity: Entity) -> None:
         """
         Add a domain entity to the modelspace.
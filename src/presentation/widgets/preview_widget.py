@@ -11,7 +11,7 @@ from src.domain.entities.point import Point
 from src.domain.entities.line import Line
 from src.domain.entities.arc import Arc
 from src.domain.entities.polyline import Polyline
-from src.domain.types import StandardColor
+from src.domain.types import EntityType, StandardColor
 
 if TYPE_CHECKING:
     from src.domain.entities.entity import Entity
@@ -250,9 +250,22 @@ class PreviewWidget(QWidget):
 
     def _draw_arc(self, painter: QPainter, arc: Arc) -> None:
         """Draw an arc entity."""
+        self._draw_arc_geometry(
+            painter, arc.center, arc.radius, arc.start_angle, arc.end_angle
+        )
+
+    def _draw_arc_geometry(
+        self,
+        painter: QPainter,
+        center_point: Point,
+        arc_radius: float,
+        arc_start_angle: float,
+        arc_end_angle: float,
+    ) -> None:
+        """Draw an arc from its center, radius and angles."""
         # Transform center
-        center = self._transform_point(arc.center)
-        radius = arc.radius * self._zoom_level
+        center = self._transform_point(center_point)
+        radius = arc_radius * self._zoom_level
 
         # Calculate bounding rect for arc
         rect = QRectF(
@@ -263,7 +276,7 @@ class PreviewWidget(QWidget):
         )
 
         # Calculate CCW span in world coordinates (handle 0°/360° boundary)
-        world_span = arc.end_angle - arc.start_angle
+        world_span = arc_end_angle - arc_start_angle
         if world_span < 0:
             world_span += 360
         elif world_span == 0:
@@ -274,20 +287,22 @@ class PreviewWidget(QWidget):
         # This matches world coordinates, so no negation needed.
         # The Y-flip in _transform_point handles the coordinate transform,
         # but Qt's angle measurement is already screen-oriented (90° = up visually).
-        start_angle = int(arc.start_angle * 16)
+        start_angle = int(arc_start_angle * 16)
         span_angle = int(world_span * 16)
 
         painter.drawArc(rect, start_angle, span_angle)
 
     def _draw_polyline(self, painter: QPainter, polyline: Polyline) -> None:
-        """Draw a polyline entity by decomposing into line/arc segments."""
-        # Decompose polyline into individual segments
-        segments = polyline.decompose()
-        for segment in segments:
-            if isinstance(segment, Line):
-                self._draw_line(painter, segment)
-            elif isinstance(segment, Arc):
-                self._draw_arc(painter, segment)
+        """Draw a polyline entity segment by segment."""
+        # Walk the segment geometry directly; building Line/Arc entities
+        # (each with a fresh id) on every repaint is wasted work
+        transform = self._transform_point
+        for kind, params in polyline.iter_segments():
+            if kind is EntityType.LINE:
+                start, end = params
+                painter.drawLine(transform(start), transform(end))
+            else:
+                self._draw_arc_geometry(painter, *params)
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Handle mouse wheel for zoom towards mouse position."""
@@ -120,10 +120,24 @@ class TestProcessDrawingUseCaseBridges:
         result = use_case.execute(entities, options)
 
         # Should have multiple segments due to bridges
-        cut_lines = [e for e in result.entities
-                     if isinstance(e, Line) and e.category == LineCategory.CUT]
+        cut_lines = result.entities_by_category[LineCategory.CUT]
         assert len(cut_lines) > 1
 
+    def test_repeated_execution_sees_mutated_entities(self) -> None:
+        """Test that executing again reflects entities changed in between."""
+        use_case = ProcessDrawingUseCase()
+        options = ProcessingOptions(generate_plywood=False)
+        entities = [
+            Line(start=Point(0, 0), end=Point(100, 0), color=StandardColor.RED),
+        ]
+
+        use_case.execute(entities, options)
+        entities[0].end = Point(500, 0)
+        result = use_case.execute(entities, options)
+
+        cut_lines = result.entities_by_category[LineCategory.CUT]
+        assert max(max(l.start.x, l.end.x) for l in cut_lines) == 500
+
     def test_short_lines_not_bridged(self) -> None:
         """Test that short lines are not bridged."""
         use_case = ProcessDrawingUseCase()
@@ -144,8 +158,7 @@ class TestProcessDrawingUseCaseBridges:
         result = use_case.execute(entities, options)
 
         # Should still have just one line
-        cut_lines = [e for e in result.entities
-                     if isinstance(e, Line) and e.category == LineCategory.CUT]
+        cut_lines = result.entities_by_category[LineCategory.CUT]
         assert len(cut_lines) == 1
 
 
@@ -173,6 +186,26 @@ class TestProcessDrawingUseCaseMirroring:
         # When mirrored around the center, coordinates should be inverted
         assert isinstance(line, Line)
 
+    def test_front_side_bridged_segments_are_mirrored(self) -> None:
+        """Test that bridged segments are mirrored around the drawing center."""
+        use_case = ProcessDrawingUseCase()
+        options = ProcessingOptions(
+            side=Side.FRONT,
+            generate_plywood=False
+        )
+        entities = [
+            Line(start=Point(0, 0), end=Point(100, 0), color=StandardColor.RED),
+            Line(start=Point(0, 50), end=Point(10, 50), color=StandardColor.RED),
+        ]
+
+        result = use_case.execute(entities, options)
+
+        # The 100mm cut line is split by bridges, the short one is mirrored to the right
+        lines = [e for e in result.entities if isinstance(e, Line)]
+        assert len([l for l in lines if l.start.y == 0]) > 1
+        short = [l for l in lines if l.start.y == 50][0]
+        assert {short.start.x, short.end.x} == {90, 100}
+
     def test_back_side_not_mirrored(self) -> None:
         """Test that back side drawing is not mirrored."""
         use_case = ProcessDrawingUseCase()
@@ -259,3 +292,23 @@ class TestProcessingResult:
         assert result.statistics is not None
         assert 'cut_count' in result.statistics
         assert 'crease_count' in result.statistics
+
+    def test_result_groups_entities_by_category(self) -> None:
+        """Test that output entities are grouped consistently with statistics."""
+        use_case = ProcessDrawingUseCase()
+        options = ProcessingOptions(
+            apply_bridges=False,
+            generate_plywood=True
+        )
+        entities = [
+            Line(start=Point(0, 0), end=Point(100, 0), color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(0, 80), color=StandardColor.BLUE),
+        ]
+
+        result = use_case.execute(entities, options)
+
+        groups = result.entities_by_category
+        assert len(groups[LineCategory.PLYWOOD]) == 4
+        assert len(groups[LineCategory.CREASE]) == 1
+        assert result.statistics['cut_count'] == len(groups[LineCategory.CUT])
+        assert all(e.category == LineCategory.CUT for e in groups[LineCategory.CUT])
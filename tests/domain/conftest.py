@@ -0,0 +1,38 @@
+"""
+Pytest fixtures shared by the domain tests.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from src.domain.entities.point import Point
+from src.domain.entities.line import Line
+from src.domain.types import StandardColor
+
+
+@pytest.fixture(scope="session")
+def line_factory() -> Callable[..., Line]:
+    """
+    Return a builder for lines from raw coordinates.
+
+    Lines are mutable (classification assigns categories in place), so every
+    call returns a new Line; only the immutable endpoints are shared.
+    """
+    def make(
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        layer: str = "0",
+        color: int = StandardColor.WHITE,
+    ) -> Line:
+        return Line(
+            start=Point.get(x1, y1),
+            end=Point.get(x2, y2),
+            layer=layer,
+            color=color,
+        )
+
+    return make
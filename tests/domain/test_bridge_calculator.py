@@ -118,6 +118,19 @@ class TestBridgeCalculator:
         last_pos = positions[-1] * line_length
         assert (line_length - last_pos) >= calculator.settings.edge_margin
 
+    def test_bridge_count_by_length(self, calculator: BridgeCalculator) -> None:
+        """Test bridge count for short, single-bridge and long lines."""
+        assert calculator.calculate_bridge_count(15.0) == 0
+        assert calculator.calculate_bridge_count(30.0) == 1
+        assert calculator.calculate_bridge_count(100.0) == 2
+        assert calculator.calculate_bridge_count(200.0) == 3
+
+    def test_bridge_count_matches_positions(self, calculator: BridgeCalculator) -> None:
+        """Test that bridge count agrees with the number of positions."""
+        for length in (10.0, 25.0, 49.9, 50.0, 100.0, 175.0, 500.0):
+            positions = calculator.calculate_bridge_positions(length)
+            assert calculator.calculate_bridge_count(length) == len(positions)
+
     def test_calculate_bridge_gaps(self, calculator: BridgeCalculator) -> None:
         """Test calculation of gap ranges for bridges."""
         line_length = 100.0
@@ -129,6 +142,24 @@ class TestBridgeCalculator:
             assert 0.0 < end < 1.0
             assert start < end
 
+    def test_repeated_gaps_are_independent_copies(self, calculator: BridgeCalculator) -> None:
+        """Test that memoized gaps cannot be modified through a returned list."""
+        gaps = calculator.calculate_bridge_gaps(100.0)
+        expected = list(gaps)
+        gaps.clear()
+
+        assert calculator.calculate_bridge_gaps(100.0) == expected
+
+    def test_gaps_follow_settings_change(self, calculator: BridgeCalculator) -> None:
+        """Test that replacing the settings recomputes gaps."""
+        default_gaps = calculator.calculate_bridge_gaps(100.0)
+
+        calculator.settings = BridgeSettings(gap_size=5.0)
+        start, end = calculator.calculate_bridge_gaps(100.0)[0]
+
+        assert calculator.calculate_bridge_gaps(100.0) != default_gaps
+        assert abs((end - start) * 100.0 - 5.0) < 0.01
+
     def test_gap_size_correct(self, calculator: BridgeCalculator) -> None:
         """Test that gap size matches settings."""
         line_length = 100.0
@@ -232,3 +263,16 @@ class TestBridgeCalculatorApply:
         expected_gaps = len(result) - 1
         expected_length = line.length - (expected_gaps * calculator.settings.gap_size)
         assert abs(total_length - expected_length) < 0.1
+
+    def test_overlapping_gaps_are_merged(self) -> None:
+        """Test that no segment is emitted inside overlapping bridge gaps."""
+        calculator = BridgeCalculator(BridgeSettings(gap_size=40.0, target_interval=20.0))
+        line = Line(start=Point(0.0, 0.0), end=Point(200.0, 0.0))
+
+        gaps = calculator.calculate_bridge_gaps(line.length)
+        result = calculator.apply_bridges(line)
+
+        assert len(result) == 2
+        for segment in result:
+            mid_ratio = segment.midpoint.x / line.length
+            assert not any(start < mid_ratio < end for start, end in gaps)
@@ -221,3 +221,40 @@ class TestCustomExcludeLayers:
         )
 
         assert dim_line not in external
+
+    def test_exclude_layers_case_insensitive(self) -> None:
+        """Test that excluded layers match regardless of case."""
+        remover = ElementRemover(exclude_layers=["Dimension"])
+        plywood_bbox = BoundingBox(min_x=100, min_y=100, max_x=500, max_y=400)
+
+        dim_line = Line(
+            start=Point(0, 0),  # Outside
+            end=Point(50, 0),
+            layer="dimension",
+            color=StandardColor.RED
+        )
+
+        result = remover.remove_external_elements(
+            [dim_line], plywood_bbox, RemovalMode.REMOVE_ALL
+        )
+
+        assert dim_line in result.kept_entities
+        assert result.removal_count == 0
+
+    def test_exclude_layers_updated_after_construction(self) -> None:
+        """Test that changes to exclude_layers are picked up."""
+        remover = ElementRemover()
+        plywood_bbox = BoundingBox(min_x=100, min_y=100, max_x=500, max_y=400)
+
+        dim_line = Line(
+            start=Point(0, 0),  # Outside
+            end=Point(50, 0),
+            layer="DIMENSION",
+            color=StandardColor.RED
+        )
+
+        assert dim_line in remover.identify_external_elements([dim_line], plywood_bbox)
+
+        remover.exclude_layers.append("DIMENSION")
+
+        assert dim_line not in remover.identify_external_elements([dim_line], plywood_bbox)
@@ -2,6 +2,7 @@
 Tests for domain entities.
 TDD: Tests written first, then implementation.
 """
+import dataclasses
 import math
 import pytest
 from src.domain.entities.point import Point
@@ -44,6 +45,13 @@ class TestPoint:
         p1 = Point(10.0, 20.0)
         assert p1.distance_to(p1) == 0.0
 
+    def test_point_get_interns_integer_coordinates(self) -> None:
+        """Test that Point.get shares integer-grid points only."""
+        assert Point.get(10, 20) is Point.get(10, 20)
+        assert Point.get(10, 20) == Point(10, 20)
+        assert Point.get(10.5, 20.0) is not Point.get(10.5, 20.0)
+        assert Point.get(10.5, 20.0) == Point(10.5, 20.0)
+
     def test_point_midpoint(self) -> None:
         """Test calculating midpoint between two points."""
         p1 = Point(0.0, 0.0)
@@ -158,6 +166,21 @@ class TestLine:
         assert segments[2].start.x == 70.0
         assert segments[2].end.x == 100.0
 
+    def test_line_split_at_unsorted_ratios(self) -> None:
+        """Test splitting keeps attributes and connects segments end to start."""
+        line = Line(
+            start=Point(0.0, 0.0),
+            end=Point(0.0, 50.0),
+            layer="CUT",
+            category=LineCategory.CUT
+        )
+        segments = line.split_at_ratios([0.8, 0.2, 0.2])
+
+        assert [s.end.y for s in segments] == [10.0, 40.0, 50.0]
+        for first, second in zip(segments, segments[1:]):
+            assert first.end == second.start
+        assert all(s.layer == "CUT" and s.category == LineCategory.CUT for s in segments)
+
     def test_line_mirror_x(self) -> None:
         """Test mirroring line across vertical axis."""
         line = Line(start=Point(10.0, 0.0), end=Point(20.0, 10.0))
@@ -183,6 +206,34 @@ class TestLine:
         assert bbox.max_x == 30.0
         assert bbox.max_y == 50.0
 
+    def test_line_geometry_follows_reassigned_points(self) -> None:
+        """Test that cached length and bounding box follow new endpoints."""
+        line = Line(start=Point(0.0, 0.0), end=Point(3.0, 4.0))
+        assert line.length == 5.0
+        assert line.bounding_box is line.bounding_box
+
+        line.end = Point(6.0, 8.0)
+
+        assert line.length == 10.0
+        assert line.bounding_box.max_x == 6.0
+
+    def test_line_has_no_instance_dict(self) -> None:
+        """Test that lines store their fields in slots."""
+        line = Line(start=Point(0.0, 0.0), end=Point(10.0, 0.0))
+
+        assert not hasattr(line, "__dict__")
+        with pytest.raises(AttributeError):
+            line.unknown_attribute = 1
+
+    def test_line_equality_is_identity(self) -> None:
+        """Test that lines compare by identity, not by coordinates."""
+        line = Line(start=Point(0.0, 0.0), end=Point(10.0, 0.0))
+        twin = Line(start=Point(0.0, 0.0), end=Point(10.0, 0.0))
+
+        assert line == line
+        assert line != twin
+        assert len({line, twin}) == 2
+
     def test_line_default_category(self) -> None:
         """Test line default category is UNKNOWN."""
         line = Line(start=Point(0.0, 0.0), end=Point(10.0, 0.0))
@@ -197,6 +248,31 @@ class TestLine:
         )
         assert line.category == LineCategory.CUT
 
+    def test_line_unchecked_matches_constructor(self) -> None:
+        """Test that _unchecked sets every field like the regular constructor."""
+        template = Line(
+            start=Point(0.0, 0.0),
+            end=Point(10.0, 0.0),
+            layer="CUT",
+            color=1,
+            linetype="DASHED",
+            category=LineCategory.CUT
+        )
+        line = Line._unchecked(Point(2.0, 0.0), Point(5.0, 0.0), template)
+
+        expected = Line(
+            start=Point(2.0, 0.0),
+            end=Point(5.0, 0.0),
+            layer="CUT",
+            color=1,
+            linetype="DASHED",
+            category=LineCategory.CUT
+        )
+        for f in dataclasses.fields(Line):
+            if f.name != "id":
+                assert getattr(line, f.name) == getattr(expected, f.name)
+        assert line.id != template.id
+
 
 class TestBoundingBox:
     """Tests for BoundingBox entity."""
@@ -257,6 +333,19 @@ class TestBoundingBox:
         assert union.max_x == 100.0
         assert union.max_y == 100.0
 
+    def test_bounding_box_union_many(self) -> None:
+        """Test union of several bounding boxes matches chained union."""
+        boxes = [
+            BoundingBox(min_x=0.0, min_y=10.0, max_x=50.0, max_y=50.0),
+            BoundingBox(min_x=30.0, min_y=-5.0, max_x=100.0, max_y=60.0),
+            BoundingBox(min_x=-20.0, min_y=0.0, max_x=10.0, max_y=90.0),
+        ]
+        union = BoundingBox.union_many(boxes)
+
+        assert union == boxes[0].union(boxes[1]).union(boxes[2])
+        with pytest.raises(ValueError):
+            BoundingBox.union_many([])
+
     def test_bounding_box_from_points(self) -> None:
         """Test creating bounding box from list of points."""
         points = [
@@ -270,6 +359,11 @@ class TestBoundingBox:
         assert bbox.max_x == 50.0
         assert bbox.max_y == 80.0
 
+    def test_bounding_box_from_empty_points(self) -> None:
+        """Test that an empty point sequence is rejected."""
+        with pytest.raises(ValueError):
+            BoundingBox.from_points([])
+
     def test_bounding_box_is_completely_outside(self) -> None:
         """Test detecting if bounding box is completely outside another."""
         outer = BoundingBox(min_x=0.0, min_y=0.0, max_x=100.0, max_y=100.0)
@@ -335,6 +429,20 @@ class TestArc:
         assert abs(bbox.max_x - 10.0) < 0.0001
         assert abs(bbox.max_y - 10.0) < 0.0001
 
+    def test_arc_bounding_box_crossing_zero(self) -> None:
+        """Test bounding box of an arc that sweeps through 0 degrees."""
+        arc = Arc(
+            center=Point(0.0, 0.0),
+            radius=10.0,
+            start_angle=270.0,
+            end_angle=90.0
+        )
+        bbox = arc.bounding_box
+        assert abs(bbox.min_x - 0.0) < 0.0001
+        assert abs(bbox.max_x - 10.0) < 0.0001
+        assert abs(bbox.min_y + 10.0) < 0.0001
+        assert abs(bbox.max_y - 10.0) < 0.0001
+
     def test_arc_mirror_x(self) -> None:
         """Test mirroring arc across vertical axis."""
         arc = Arc(
@@ -82,6 +82,51 @@ class TestEntityClassifierByColor:
 
         assert result == LineCategory.UNKNOWN
 
+    def test_custom_color_map_outside_aci_range(self) -> None:
+        """Test custom color mappings inside and outside the ACI range."""
+        classifier = EntityClassifier(
+            COLOR_MAP={StandardColor.YELLOW: LineCategory.CUT, 1000: LineCategory.CREASE}
+        )
+
+        assert classifier.classify(Line(color=StandardColor.YELLOW)) == LineCategory.CUT
+        assert classifier.classify(Line(color=1000)) == LineCategory.CREASE
+        assert classifier.classify(Line(color=StandardColor.RED)) == LineCategory.UNKNOWN
+        assert classifier.classify(Line(color=-1)) == LineCategory.UNKNOWN
+
+    def test_replaced_color_map_takes_effect(self) -> None:
+        """Test that replacing COLOR_MAP discards earlier classifications."""
+        classifier = EntityClassifier()
+        line = Line(start=Point(0, 0), end=Point(100, 0), color=StandardColor.RED)
+        assert classifier.classify(line) == LineCategory.CUT
+
+        classifier.COLOR_MAP = {StandardColor.RED: LineCategory.CREASE}
+
+        assert classifier.classify(line) == LineCategory.CREASE
+
+    def test_color_map_edited_in_place_takes_effect(self) -> None:
+        """Test that a color remapped in the existing dict is looked up."""
+        classifier = EntityClassifier()
+        assert classifier._classify_by_color(StandardColor.YELLOW) == LineCategory.UNKNOWN
+
+        classifier.COLOR_MAP[StandardColor.YELLOW] = LineCategory.CREASE
+
+        assert classifier._classify_by_color(StandardColor.YELLOW) == LineCategory.CREASE
+
+    def test_in_place_edits_reach_memoized_classifications(self) -> None:
+        """Test that editing either mapping in place discards memoized categories."""
+        classifier = EntityClassifier()
+        yellow = Line(start=Point(0, 0), end=Point(100, 0), color=StandardColor.YELLOW)
+        mylayer = Line(start=Point(0, 0), end=Point(100, 0), layer="MYLAYER", color=256)
+        assert classifier.classify(yellow) == LineCategory.UNKNOWN
+        assert classifier.classify(mylayer) == LineCategory.UNKNOWN
+
+        classifier.COLOR_MAP[StandardColor.YELLOW] = LineCategory.CREASE
+        classifier.LAYER_PATTERNS[LineCategory.CUT].append("MYLAYER")
+
+        assert classifier.classify(yellow) == LineCategory.CREASE
+        assert classifier.classify(mylayer) == LineCategory.CUT
+        assert classifier.classify_all([yellow])[LineCategory.CREASE] == [yellow]
+
 
 class TestEntityClassifierByLayer:
     """Test entity classification by layer name."""
@@ -177,6 +222,35 @@ class TestEntityClassifierByLayer:
 
         assert result == LineCategory.PLYWOOD
 
+    def test_custom_patterns_are_case_insensitive(self) -> None:
+        """Test that lower-case custom patterns match upper-case layers."""
+        classifier = EntityClassifier(
+            LAYER_PATTERNS={LineCategory.CREASE: ["rule"]}
+        )
+        line = Line(start=Point(0, 0), end=Point(100, 0), layer="CREASE_RULE")
+
+        assert classifier.classify(line) == LineCategory.CREASE
+
+    def test_replaced_patterns_take_effect(self) -> None:
+        """Test that assigning new LAYER_PATTERNS updates classification."""
+        classifier = EntityClassifier()
+        line = Line(start=Point(0, 0), end=Point(100, 0), layer="MARK", color=256)
+
+        assert classifier.classify(line) == LineCategory.UNKNOWN
+
+        classifier.LAYER_PATTERNS = {LineCategory.AUXILIARY: ["mark"]}
+
+        assert classifier.classify(line) == LineCategory.AUXILIARY
+
+    def test_patterns_edited_in_place_take_effect(self) -> None:
+        """Test that a pattern appended to an existing list is matched."""
+        classifier = EntityClassifier()
+        assert classifier._classify_by_layer("MYLAYER") == LineCategory.UNKNOWN
+
+        classifier.LAYER_PATTERNS[LineCategory.CUT].append("mylayer")
+
+        assert classifier._classify_by_layer("MYLAYER") == LineCategory.CUT
+
 
 class TestEntityClassifierPriority:
     """Test classification priority (layer takes precedence over color)."""
@@ -229,6 +303,40 @@ class TestEntityClassifierBatch:
         assert results[LineCategory.CREASE] == [entities[1]]
         assert results[LineCategory.AUXILIARY] == [entities[2]]
 
+    def test_classify_all_keeps_input_order(self) -> None:
+        """Test that entities sharing attributes are grouped in input order."""
+        classifier = EntityClassifier()
+        entities = [
+            Line(start=Point(0, 0), end=Point(10, 0), color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(20, 0), color=StandardColor.BLUE),
+            Line(start=Point(0, 0), end=Point(30, 0), color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(40, 0), layer="CUT", color=StandardColor.BLUE),
+        ]
+
+        results = classifier.classify_all(entities)
+
+        assert results[LineCategory.CUT] == [entities[0], entities[2], entities[3]]
+        assert results[LineCategory.CREASE] == [entities[1]]
+
+    def test_classify_batch_keeps_input_order(self) -> None:
+        """Test that classify_batch returns one category per entity, in order."""
+        classifier = EntityClassifier()
+        entities = [
+            Line(start=Point(0, 0), end=Point(10, 0), color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(20, 0), color=StandardColor.BLUE),
+            Line(start=Point(0, 0), end=Point(30, 0), color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(40, 0), layer="CUT", color=StandardColor.BLUE),
+        ]
+
+        categories = classifier.classify_batch(entities)
+
+        assert categories == [
+            LineCategory.CUT,
+            LineCategory.CREASE,
+            LineCategory.CUT,
+            LineCategory.CUT,
+        ]
+
     def test_classify_returns_all_categories(self) -> None:
         """Test that classify_all returns all category keys."""
         classifier = EntityClassifier()
@@ -255,6 +363,26 @@ class TestEntityClassifierBatch:
 
         assert updated.category == LineCategory.CUT
 
+    def test_apply_categories_with_repeated_attributes(self) -> None:
+        """Test that entities sharing a layer/color pair keep their own order."""
+        classifier = EntityClassifier()
+        entities = [
+            Line(start=Point(0, 0), end=Point(10, 0), color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(10, 0), layer="CREASE", color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(20, 0), color=StandardColor.RED),
+            Line(start=Point(0, 0), end=Point(30, 0), color=StandardColor.YELLOW),
+        ]
+
+        updated = classifier.apply_categories(entities)
+
+        assert [e.category for e in updated] == [
+            LineCategory.CUT,
+            LineCategory.CREASE,
+            LineCategory.CUT,
+            LineCategory.UNKNOWN,
+        ]
+        assert [e.end.x for e in updated] == [10, 10, 20, 30]
+
 
 class TestEntityClassifierArc:
     """Test classification of Arc entities."""
@@ -8,6 +8,7 @@ from src.domain.entities.line import Line
 from src.domain.entities.arc import Arc
 from src.domain.entities.bounding_box import BoundingBox
 from src.domain.services.geometry_service import GeometryService
+from src.domain.types import LineCategory
 
 
 class TestGeometryServiceBoundingBox:
@@ -61,8 +62,23 @@ class TestGeometryServiceBoundingBox:
 
         # Arc from 0 to 90 degrees should extend from center to right and top
         assert bbox is not None
-        assert bbox.min_x >= 50  # Right half of arc
-        assert bbox.max_x <= 80  # Center + radius
+        assert bbox.min_x == pytest.approx(50)
+        assert bbox.min_y == pytest.approx(50)
+        assert bbox.max_x == pytest.approx(80)  # Center + radius
+        assert bbox.max_y == pytest.approx(80)
+
+    def test_bounding_box_with_arc_over_cardinal_angle(self) -> None:
+        """Test that an arc sweeping past 90 degrees reaches its top extreme."""
+        service = GeometryService()
+        entities = [
+            Arc(center=Point(0, 0), radius=10, start_angle=45, end_angle=135)
+        ]
+
+        bbox = service.calculate_bounding_box(entities)
+
+        assert bbox is not None
+        assert bbox.max_y == 10
+        assert bbox.min_x == pytest.approx(-bbox.max_x)
 
 
 class TestGeometryServiceMirror:
@@ -80,6 +96,26 @@ class TestGeometryServiceMirror:
         assert mirrored.end.x == 70  # 50 + (50 - 30)
         assert mirrored.end.y == 40
 
+    def test_mirror_line_keeps_identity_and_attributes(self) -> None:
+        """Test that a mirrored line keeps its id and drawing attributes."""
+        service = GeometryService()
+        line = Line(
+            start=Point(10, 20),
+            end=Point(30, 40),
+            layer="CUT",
+            color=1,
+            linetype="DASHED",
+            category=LineCategory.CUT
+        )
+
+        mirrored = service.mirror_x(line, center_x=50)
+
+        assert mirrored is not line
+        assert mirrored.id == line.id
+        assert (mirrored.layer, mirrored.color, mirrored.linetype) == ("CUT", 1, "DASHED")
+        assert mirrored.category == LineCategory.CUT
+        assert mirrored.length == line.length
+
     def test_mirror_arc_x_axis(self) -> None:
         """Test mirroring an arc across X axis."""
         service = GeometryService()
@@ -203,3 +239,18 @@ class TestGeometryServiceDistances:
         distance = service.distance(Point(10, 20), Point(10, 20))
 
         assert distance == 0.0
+
+    def test_distance_sq_between_points(self) -> None:
+        """Test squared distance agrees with distance."""
+        service = GeometryService()
+
+        assert service.distance_sq(Point(0, 0), Point(3, 4)) == 25.0
+        assert service.distance_sq(Point(10, 20), Point(10, 20)) == 0.0
+
+    def test_distance_within(self) -> None:
+        """Test the distance threshold predicate, including its boundary."""
+        service = GeometryService()
+
+        assert service.distance_within(Point(0, 0), Point(3, 4), 5.0)
+        assert not service.distance_within(Point(0, 0), Point(3, 4), 4.99)
+        assert service.distance_within(Point(10, 20), Point(10, 20), 0.0)
@@ -40,6 +40,10 @@ class TestPaperSizeCreation:
         assert paper.width == 788
         assert paper.height == 1091
 
+    def test_create_from_standard_is_shared(self) -> None:
+        """Test that standard sizes are built once and shared."""
+        assert PaperSize.from_standard("A4") is PaperSize.from_standard("A4")
+
     def test_create_from_unknown_standard_raises(self) -> None:
         """Test that unknown standard name raises ValueError."""
         with pytest.raises(ValueError, match="Unknown standard size"):
@@ -119,6 +123,22 @@ class TestPaperSizeProperties:
         assert rotated.height == 500
         assert "회전" in rotated.name
 
+    def test_repeated_rotate_is_shared(self) -> None:
+        """Test that rotating equal sizes returns the same instance."""
+        first = PaperSize(name="Test", width=500, height=700).rotate()
+        second = PaperSize(name="Test", width=500, height=700).rotate()
+
+        assert first is second
+
+    def test_rotate_validates_swapped_dimensions(self) -> None:
+        """Test that a rotation exceeding the width limit is still rejected."""
+        paper = PaperSize(name="Tall", width=1000, height=2500)
+
+        with pytest.raises(ValueError):
+            paper.rotate()
+        with pytest.raises(ValueError):
+            paper.rotate()
+
 
 class TestPaperSizeFits:
     """Test drawing fit checking."""
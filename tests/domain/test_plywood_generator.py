@@ -7,7 +7,7 @@ from src.domain.entities.point import Point
 from src.domain.entities.line import Line
 from src.domain.entities.bounding_box import BoundingBox
 from src.domain.services.plywood_generator import PlywoodGenerator, PlywoodSettings
-from src.domain.types import PlateType, StandardColor
+from src.domain.types import PlateType, StandardColor, LineCategory
 
 
 class TestPlywoodSettings:
@@ -33,6 +33,12 @@ class TestPlywoodSettings:
 
         assert settings.bottom_margin == 15.0
 
+    def test_plate_settings_are_shared(self) -> None:
+        """Test that each plate type returns one shared settings instance."""
+        for plate_type in PlateType:
+            settings = PlywoodSettings.for_plate_type(plate_type)
+            assert PlywoodSettings.for_plate_type(plate_type) is settings
+
 
 class TestPlywoodGeneratorRectangle:
     """Test plywood rectangle generation."""
@@ -83,6 +89,18 @@ class TestPlywoodGeneratorRectangle:
         for line in lines:
             assert line.layer == "PLYWOOD"
 
+    def test_rectangle_edges_are_chained(self) -> None:
+        """Test that each edge starts where the previous one ends."""
+        generator = PlywoodGenerator()
+        bbox = BoundingBox(min_x=0, min_y=0, max_x=100, max_y=80)
+
+        lines = generator.generate_rectangle(bbox)
+
+        assert lines[0].start == Point(0, 0)
+        for i, line in enumerate(lines):
+            assert line.end == lines[(i + 1) % 4].start
+            assert line.category == LineCategory.PLYWOOD
+
 
 class TestPlywoodGeneratorWithMargins:
     """Test plywood generation with margins."""
@@ -161,6 +179,25 @@ class TestPlywoodGeneratorForEntities:
 
         assert plywood_lines == []
 
+    def test_generate_batch_matches_single_drawings(self) -> None:
+        """Test that batch frames match per-drawing generation."""
+        generator = PlywoodGenerator()
+        drawings = [
+            [Line(start=Point(0, 0), end=Point(100, 80))],
+            [],
+            [Line(start=Point(-50, 10), end=Point(20, 40))],
+        ]
+        settings = PlywoodSettings.for_plate_type(PlateType.AUTO)
+
+        frames = generator.generate_batch(drawings, settings)
+
+        assert len(frames) == 3
+        for frame, entities in zip(frames, drawings):
+            expected = generator.generate_for_entities(entities, settings)
+            assert [(l.start, l.end) for l in frame] == [
+                (l.start, l.end) for l in expected
+            ]
+
 
 class TestPlywoodGeneratorPositioning:
     """Test plywood drawing positioning."""
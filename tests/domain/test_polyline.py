@@ -136,6 +136,15 @@ class TestPolylineProperties:
         assert max_x == 100
         assert max_y == 100
 
+    def test_bounding_box_follows_new_vertices(self) -> None:
+        """Test that the cached bounding box follows reassigned vertices."""
+        polyline = Polyline(vertices=(PolylineVertex(0, 0), PolylineVertex(10, 5)))
+        assert polyline.get_bounding_box() == (0, 0, 10, 5)
+
+        polyline.vertices = (PolylineVertex(-5, 0), PolylineVertex(20, 30))
+
+        assert polyline.get_bounding_box() == (-5, 0, 20, 30)
+
     def test_with_category(self) -> None:
         """Test creating copy with new category."""
         polyline = Polyline(
@@ -184,6 +193,10 @@ class TestPolylineDecompose:
         segments = polyline.decompose()
 
         assert len(segments) == 3  # Includes closing segment
+        assert segments[2].start == Point(10, 10)
+        assert segments[2].end == Point(0, 0)
+        # Consecutive segments meet at the shared vertex
+        assert segments[0].end == segments[1].start
 
     def test_decompose_with_bulge(self) -> None:
         """Test decomposing polyline with arc segment (bulge)."""
@@ -220,6 +233,29 @@ class TestPolylineDecompose:
 
         assert len(segments) == 0
 
+    def test_iter_segments_matches_decompose(self) -> None:
+        """Test that segment geometry matches the decomposed entities."""
+        vertices = (
+            PolylineVertex(0, 0, bulge=0.414),
+            PolylineVertex(10, 0),
+            PolylineVertex(20, 0),
+            PolylineVertex(20, 10),
+        )
+        polyline = Polyline(vertices=vertices, closed=True)
+
+        segments = polyline.decompose()
+        geometry = list(polyline.iter_segments())
+
+        assert [kind for kind, _ in geometry] == [s.entity_type for s in segments]
+        for (kind, params), segment in zip(geometry, segments):
+            if kind is EntityType.LINE:
+                assert params == (segment.start, segment.end)
+            else:
+                assert params == (
+                    segment.center, segment.radius,
+                    segment.start_angle, segment.end_angle,
+                )
+
 
 class TestPolylineArcFromBulge:
     """Test arc generation from bulge values."""
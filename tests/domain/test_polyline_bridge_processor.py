@@ -46,7 +46,7 @@ class TestPolylineBridgeProcessorBasic:
         """Test decomposing a polyline into segments."""
         processor = PolylineBridgeProcessor()
         polyline = Polyline.from_points(
-            [Point(0, 0), Point(100, 0), Point(100, 100)],
+            [(0, 0), (100, 0), (100, 100)],
             layer="CUT",
             color=StandardColor.RED,
             category=LineCategory.CUT,
@@ -74,7 +74,7 @@ class TestPolylineBridgeProcessorWithBridges:
         )
         # Create a polyline with one long segment (200mm)
         polyline = Polyline.from_points(
-            [Point(0, 0), Point(200, 0)],
+            [(0, 0), (200, 0)],
             category=LineCategory.CUT,
         )
 
@@ -94,7 +94,7 @@ class TestPolylineBridgeProcessorWithBridges:
             )
         )
         polyline = Polyline.from_points(
-            [Point(0, 0), Point(100, 0)],
+            [(0, 0), (100, 0)],
             category=LineCategory.CREASE,
         )
 
@@ -107,7 +107,7 @@ class TestPolylineBridgeProcessorWithBridges:
         """Test that auxiliary lines don't get bridges."""
         processor = PolylineBridgeProcessor()
         polyline = Polyline.from_points(
-            [Point(0, 0), Point(200, 0)],
+            [(0, 0), (200, 0)],
             category=LineCategory.AUXILIARY,
         )
 
@@ -140,9 +140,9 @@ class TestPolylineCounting:
         """Test counting polylines in entity list."""
         processor = PolylineBridgeProcessor()
         entities = [
-            Polyline.from_points([Point(0, 0), Point(10, 0)]),
+            Polyline.from_points([(0, 0), (10, 0)]),
             Line(Point(0, 0), Point(10, 0)),
-            Polyline.from_points([Point(0, 0), Point(10, 0), Point(10, 10)]),
+            Polyline.from_points([(0, 0), (10, 0), (10, 10)]),
         ]
 
         count = processor.get_polyline_count(entities)
@@ -154,11 +154,11 @@ class TestPolylineCounting:
         processor = PolylineBridgeProcessor()
         entities = [
             # Polyline with 2 segments
-            Polyline.from_points([Point(0, 0), Point(10, 0), Point(10, 10)]),
+            Polyline.from_points([(0, 0), (10, 0), (10, 10)]),
             # Single line (1 segment)
             Line(Point(0, 0), Point(10, 0)),
             # Closed polyline with 3 segments
-            Polyline.from_points([Point(0, 0), Point(10, 0), Point(10, 10)], closed=True),
+            Polyline.from_points([(0, 0), (10, 0), (10, 10)], closed=True),
         ]
 
         count = processor.get_segment_count(entities)
@@ -173,7 +173,7 @@ class TestDecomposeOnly:
         """Test decomposing polylines without bridge application."""
         processor = PolylineBridgeProcessor()
         polyline = Polyline.from_points(
-            [Point(0, 0), Point(200, 0)],  # Long segment that would get bridges
+            [(0, 0), (200, 0)],  # Long segment that would get bridges
             category=LineCategory.CUT,
         )
 
@@ -199,7 +199,7 @@ class TestMixedEntities:
         entities = [
             Line(Point(0, 0), Point(50, 0), color=StandardColor.RED),
             Polyline.from_points(
-                [Point(0, 10), Point(100, 10), Point(100, 60)],
+                [(0, 10), (100, 10), (100, 60)],
                 category=LineCategory.CUT,
             ),
             Line(Point(0, 20), Point(50, 20), color=StandardColor.BLUE),
@@ -1,6 +1,9 @@
 """Tests for SegmentConnector service."""
 from __future__ import annotations
 
+from math import isclose
+from typing import Callable
+
 import pytest
 
 from src.domain.entities.point import Point
@@ -9,6 +12,17 @@ from src.domain.services.segment_connector import SegmentConnector, ConnectionCa
 from src.domain.types import StandardColor
 
 
+def _chain(count: int) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+    """Build a row of 10mm lines, each starting 0.05mm after the previous ends."""
+    return [((i * 10.05, 0), (i * 10.05 + 10, 0)) for i in range(count)]
+
+
+@pytest.fixture(scope="module")
+def connector() -> SegmentConnector:
+    """Create a connector with the default 0.1mm tolerance."""
+    return SegmentConnector(tolerance=0.1)
+
+
 class TestFindConnectablePairs:
     """Test finding connectable pairs."""
 
@@ -22,88 +36,143 @@ class TestFindConnectablePairs:
         candidates = connector.find_connectable_pairs([line1, line2])
 
         assert len(candidates) == 1
-        assert candidates[0].distance == pytest.approx(0.05, abs=0.01)
-
-    def test_no_connection_when_too_far(self) -> None:
-        """Test no connection when distance exceeds tolerance."""
-        connector = SegmentConnector(tolerance=0.1)
-
-        line1 = Line(start=Point(0, 0), end=Point(100, 0))
-        line2 = Line(start=Point(101, 0), end=Point(200, 0))  # 1mm gap
-
-        candidates = connector.find_connectable_pairs([line1, line2])
+        assert isclose(candidates[0].distance, 0.05, abs_tol=0.01)
+
+    @pytest.mark.parametrize(
+        "lines,expected",
+        [
+            pytest.param(
+                [((0, 0), (100, 0)), ((101, 0), (200, 0))], 0, id="too-far"
+            ),
+            # Distance is 0, which is not > 0 (already connected)
+            pytest.param(
+                [((0, 0), (100, 0)), ((100, 0), (200, 0))], 0, id="same-point"
+            ),
+            pytest.param(
+                [((0, 0), (100, 0)), ((100.05, 0), (200, 0)), ((200.05, 0), (300, 0))],
+                2,
+                id="multiple",
+            ),
+            # A long chain guards against a quadratic pair search creeping back
+            pytest.param(_chain(10000), 9999, id="chain-10k"),
+        ],
+    )
+    def test_candidate_count(
+        self,
+        connector: SegmentConnector,
+        lines: list[tuple[tuple[float, float], tuple[float, float]]],
+        expected: int
+    ) -> None:
+        """Test the number of candidates found for a set of lines."""
+        entities = [
+            Line(start=Point(*start), end=Point(*end)) for start, end in lines
+        ]
 
-        assert len(candidates) == 0
+        assert len(connector.find_connectable_pairs(entities)) == expected
 
-    def test_no_connection_when_same_point(self) -> None:
-        """Test no connection when distance is zero (already connected)."""
+    def test_connection_across_grid_cells(self) -> None:
+        """Test endpoints on either side of the origin are still paired."""
         connector = SegmentConnector(tolerance=0.1)
 
-        line1 = Line(start=Point(0, 0), end=Point(100, 0))
-        line2 = Line(start=Point(100, 0), end=Point(200, 0))  # Exactly same point
+        line1 = Line(start=Point(-100, -0.01), end=Point(-0.05, -0.01))
+        line2 = Line(start=Point(0.04, 0.01), end=Point(100, 0.01))
 
         candidates = connector.find_connectable_pairs([line1, line2])
 
-        # Distance is 0, which is not > 0
-        assert len(candidates) == 0
+        assert len(candidates) == 1
+        assert candidates[0].entity_a is line1
 
-    def test_multiple_connections(self) -> None:
-        """Test finding multiple connections."""
+    def test_candidates_ordered_by_entity(self) -> None:
+        """Test that candidates follow the input order of the entities."""
         connector = SegmentConnector(tolerance=0.1)
 
         lines = [
+            Line(start=Point(500, 0), end=Point(600, 0)),
             Line(start=Point(0, 0), end=Point(100, 0)),
+            Line(start=Point(600.05, 0), end=Point(700, 0)),
             Line(start=Point(100.05, 0), end=Point(200, 0)),
-            Line(start=Point(200.05, 0), end=Point(300, 0)),
         ]
 
         candidates = connector.find_connectable_pairs(lines)
 
-        assert len(candidates) == 2
+        assert [(c.entity_a, c.entity_b) for c in candidates] == [
+            (lines[0], lines[2]),
+            (lines[1], lines[3]),
+        ]
+
+    def test_zero_tolerance_finds_nothing(self) -> None:
+        """Test that a zero tolerance never yields candidates."""
+        connector = SegmentConnector(tolerance=0.0)
+
+        line1 = Line(start=Point(0, 0), end=Point(100, 0))
+        line2 = Line(start=Point(100.05, 0), end=Point(200, 0))
+
+        assert connector.find_connectable_pairs([line1, line2]) == []
+
+    def test_nan_tolerance_finds_nothing(self) -> None:
+        """Test that a NaN tolerance never yields candidates."""
+        connector = SegmentConnector(tolerance=float("nan"))
+
+        line1 = Line(start=Point(0, 0), end=Point(100, 0))
+        line2 = Line(start=Point(100.05, 0), end=Point(200, 0))
+
+        assert connector.find_connectable_pairs([line1, line2]) == []
+
+    def test_cell_overflow_falls_back_to_pairwise_scan(self) -> None:
+        """Test that a tolerance too small to bucket still finds close pairs."""
+        connector = SegmentConnector(tolerance=1e-320)
+
+        line1 = Line(start=Point(-100, 0), end=Point(0, 0))
+        line2 = Line(start=Point(5e-324, 0), end=Point(100, 0))
+        line3 = Line(start=Point(300, 0), end=Point(400, 0))
+
+        candidates = connector.find_connectable_pairs([line1, line2, line3])
+
+        assert [(c.entity_a, c.entity_b) for c in candidates] == [(line1, line2)]
 
 
 class TestLayerAndColorConstraints:
     """Test layer and color constraints."""
 
-    def test_same_layer_only(self) -> None:
+    def test_same_layer_only(self, line_factory: Callable[..., Line]) -> None:
         """Test same layer constraint."""
         connector = SegmentConnector(tolerance=0.1, same_layer_only=True)
 
-        line1 = Line(start=Point(0, 0), end=Point(100, 0), layer="CUT")
-        line2 = Line(start=Point(100.05, 0), end=Point(200, 0), layer="CREASE")
+        line1 = line_factory(0, 0, 100, 0, layer="CUT")
+        line2 = line_factory(100.05, 0, 200, 0, layer="CREASE")
 
         candidates = connector.find_connectable_pairs([line1, line2])
 
         assert len(candidates) == 0
 
-    def test_same_layer_matches(self) -> None:
+    def test_same_layer_matches(self, line_factory: Callable[..., Line]) -> None:
         """Test same layer match."""
         connector = SegmentConnector(tolerance=0.1, same_layer_only=True)
 
-        line1 = Line(start=Point(0, 0), end=Point(100, 0), layer="CUT")
-        line2 = Line(start=Point(100.05, 0), end=Point(200, 0), layer="CUT")
+        line1 = line_factory(0, 0, 100, 0, layer="CUT")
+        line2 = line_factory(100.05, 0, 200, 0, layer="CUT")
 
         candidates = connector.find_connectable_pairs([line1, line2])
 
         assert len(candidates) == 1
 
-    def test_same_color_only(self) -> None:
+    def test_same_color_only(self, line_factory: Callable[..., Line]) -> None:
         """Test same color constraint."""
         connector = SegmentConnector(tolerance=0.1, same_color_only=True)
 
-        line1 = Line(start=Point(0, 0), end=Point(100, 0), color=StandardColor.RED)
-        line2 = Line(start=Point(100.05, 0), end=Point(200, 0), color=StandardColor.BLUE)
+        line1 = line_factory(0, 0, 100, 0, color=StandardColor.RED)
+        line2 = line_factory(100.05, 0, 200, 0, color=StandardColor.BLUE)
 
         candidates = connector.find_connectable_pairs([line1, line2])
 
         assert len(candidates) == 0
 
-    def test_same_color_matches(self) -> None:
+    def test_same_color_matches(self, line_factory: Callable[..., Line]) -> None:
         """Test same color match."""
         connector = SegmentConnector(tolerance=0.1, same_color_only=True)
 
-        line1 = Line(start=Point(0, 0), end=Point(100, 0), color=StandardColor.RED)
-        line2 = Line(start=Point(100.05, 0), end=Point(200, 0), color=StandardColor.RED)
+        line1 = line_factory(0, 0, 100, 0, color=StandardColor.RED)
+        line2 = line_factory(100.05, 0, 200, 0, color=StandardColor.RED)
 
         candidates = connector.find_connectable_pairs([line1, line2])
 
@@ -130,8 +199,8 @@ class TestConnectSegments:
         # Check merged line spans full length
         min_x = min(merged.start.x, merged.end.x)
         max_x = max(merged.start.x, merged.end.x)
-        assert min_x == pytest.approx(0, abs=0.1)
-        assert max_x == pytest.approx(200, abs=0.1)
+        assert isclose(min_x, 0, abs_tol=0.1)
+        assert isclose(max_x, 200, abs_tol=0.1)
 
     def test_connect_non_collinear_lines(self) -> None:
         """Test extending non-collinear lines to meet."""
@@ -173,7 +242,7 @@ class TestConnectionCandidate:
         )
 
         midpoint = candidate.midpoint
-        assert midpoint.x == pytest.approx(100.05, abs=0.01)
+        assert isclose(midpoint.x, 100.05, abs_tol=0.01)
         assert midpoint.y == 0
 
 
@@ -47,7 +47,7 @@ class TestStraightKnifeGeneration:
         knives = generator.generate_at_center(drawing_bbox, plywood_bbox, settings)
 
         # Find left knife (from plywood left to drawing left)
-        left_knife = [k for k in knives if k.start.x == 0 or k.end.x == 0][0]
+        left_knife = next(k for k in knives if k.start.x == 0 or k.end.x == 0)
 
         min_x = min(left_knife.start.x, left_knife.end.x)
         max_x = max(left_knife.start.x, left_knife.end.x)
@@ -65,7 +65,7 @@ class TestStraightKnifeGeneration:
         knives = generator.generate_at_center(drawing_bbox, plywood_bbox, settings)
 
         # Find right knife (from drawing right to plywood right)
-        right_knife = [k for k in knives if k.start.x == 500 or k.end.x == 500][0]
+        right_knife = next(k for k in knives if k.start.x == 500 or k.end.x == 500)
 
         min_x = min(right_knife.start.x, right_knife.end.x)
         max_x = max(right_knife.start.x, right_knife.end.x)
@@ -110,9 +110,9 @@ class TestStraightKnifeGeneration:
         # Should have 2 knives per Y position = 6 total
         assert len(knives) == 6
 
-        # Verify all Y positions are covered
-        y_values = set(k.start.y for k in knives)
-        assert y_values == {150, 200, 250}
+        # Verify all Y positions are covered by horizontal knives
+        assert {k.start.y for k in knives} == {150, 200, 250}
+        assert all(k.end.y == k.start.y for k in knives)
 
     def test_knife_color_and_layer(self) -> None:
         """Test knife color and layer settings."""
@@ -0,0 +1,20 @@
+"""
+Pytest fixtures shared by the infrastructure tests.
+"""
+from __future__ import annotations
+
+import pytest
+
+from src.infrastructure.dxf.ezdxf_adapter import EzdxfReader, EzdxfWriter
+
+
+@pytest.fixture(scope="session")
+def reader() -> EzdxfReader:
+    """Create an EzdxfReader; it keeps no state between reads."""
+    return EzdxfReader()
+
+
+@pytest.fixture(scope="session")
+def writer() -> EzdxfWriter:
+    """Create an EzdxfWriter; it keeps no state between writes."""
+    return EzdxfWriter()
@@ -1,51 +1,102 @@
 """
 Tests for ezdxf adapter implementation.
 """
+import io
+import ezdxf
 import pytest
 from pathlib import Path
+from typing import Callable
 import tempfile
 
 from src.infrastructure.dxf.ezdxf_adapter import EzdxfReader, EzdxfWriter
+from src.domain.entities.entity import Entity
 from src.domain.entities.point import Point
 from src.domain.entities.line import Line
 from src.domain.entities.arc import Arc
+from src.domain.exceptions import DxfParseError
 from src.domain.types import LineCategory
 
 
-class TestEzdxfReader:
-    """Tests for EzdxfReader."""
-
-    @pytest.fixture
-    def reader(self) -> EzdxfReader:
-        """Create an EzdxfReader instance."""
-        return EzdxfReader()
-
-    @pytest.fixture
-    def sample_dxf(self, tmp_path: Path) -> Path:
-        """Create a sample DXF file for testing."""
-        import ezdxf
+@pytest.fixture(scope="module")
+def dxf_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Return one directory for the DXF files written by this module.
 
-        doc = ezdxf.new('R2010')
-        msp = doc.modelspace()
+    Every test writes its own file name, so they do not need a directory each.
+    """
+    return tmp_path_factory.mktemp("dxf")
 
-        # Add a line
-        msp.add_line((0, 0), (100, 0), dxfattribs={'layer': 'CUT', 'color': 1})
 
-        # Add another line
-        msp.add_line((0, 50), (100, 50), dxfattribs={'layer': 'CREASE', 'color': 5})
-
-        # Add an arc
-        msp.add_arc(
-            center=(50, 100),
+def _sample_entities() -> list[Entity]:
+    """Create the domain entities drawn in the sample DXF file."""
+    return [
+        Line(start=Point(0, 0), end=Point(100, 0), layer="CUT", color=1),
+        Line(start=Point(0, 50), end=Point(100, 50), layer="CREASE", color=5),
+        Arc(
+            center=Point(50, 100),
             radius=25,
             start_angle=0,
             end_angle=180,
-            dxfattribs={'layer': 'CUT', 'color': 1}
-        )
+            layer="CUT",
+            color=1
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_dxf(dxf_dir: Path) -> Path:
+    """
+    Create a sample DXF file for testing.
+
+    Tests only read the file, so it is built and saved once per module. It
+    holds the same drawing as _sample_entities() but is written with ezdxf
+    directly, so the reader tests do not depend on EzdxfWriter.
+    """
+    doc = ezdxf.new('R2010')
+    msp = doc.modelspace()
+
+    # Add a line
+    msp.add_line((0, 0), (100, 0), dxfattribs={'layer': 'CUT', 'color': 1})
+
+    # Add another line
+    msp.add_line((0, 50), (100, 50), dxfattribs={'layer': 'CREASE', 'color': 5})
+
+    # Add an arc
+    msp.add_arc(
+        center=(50, 100),
+        radius=25,
+        start_angle=0,
+        end_angle=180,
+        dxfattribs={'layer': 'CUT', 'color': 1}
+    )
+
+    file_path = dxf_dir / "test.dxf"
+    doc.saveas(file_path)
+    return file_path
+
+
+@pytest.fixture
+def roundtrip(
+    writer: EzdxfWriter,
+    reader: EzdxfReader
+) -> Callable[[list[Entity]], list[Entity]]:
+    """
+    Return a helper that writes entities as DXF and reads them back.
+
+    The DXF text goes through memory; tests about files on disk use
+    write/read directly.
+    """
+    def _do(entities: list[Entity]) -> list[Entity]:
+        stream = io.StringIO()
+        writer.write_stream(entities, stream)
+        stream.seek(0)
+        return reader.read_stream(stream)
+
+    return _do
 
-        file_path = tmp_path / "test.dxf"
-        doc.saveas(file_path)
-        return file_path
+
+class TestEzdxfReader:
+    """Tests for EzdxfReader."""
 
     def test_read_file(self, reader: EzdxfReader, sample_dxf: Path) -> None:
         """Test reading a DXF file."""
@@ -95,6 +146,24 @@ class TestEzdxfReader:
         with pytest.raises(FileNotFoundError):
             reader.read(Path("/nonexistent/file.dxf"))
 
+    def test_read_stream_matches_file(
+        self,
+        reader: EzdxfReader,
+        sample_dxf: Path
+    ) -> None:
+        """Test that reading DXF text from a stream matches reading the file."""
+        with open(sample_dxf, encoding="utf-8") as stream:
+            entities = reader.read_stream(stream)
+
+        expected = reader.read(sample_dxf)
+        assert [type(e) for e in entities] == [type(e) for e in expected]
+        assert [e.layer for e in entities] == [e.layer for e in expected]
+
+    def test_read_stream_invalid(self, reader: EzdxfReader) -> None:
+        """Test that unparseable stream content raises DxfParseError."""
+        with pytest.raises(DxfParseError):
+            reader.read_stream(io.StringIO("not a dxf file"))
+
     def test_get_file_info(self, reader: EzdxfReader, sample_dxf: Path) -> None:
         """Test getting file info."""
         info = reader.get_file_info(sample_dxf)
@@ -106,111 +175,28 @@ class TestEzdxfReader:
 class TestEzdxfWriter:
     """Tests for EzdxfWriter."""
 
-    @pytest.fixture
-    def writer(self) -> EzdxfWriter:
-        """Create an EzdxfWriter instance."""
-        return EzdxfWriter()
-
-    @pytest.fixture
-    def reader(self) -> EzdxfReader:
-        """Create an EzdxfReader instance for verification."""
-        return EzdxfReader()
-
-    def test_write_empty_file(self, writer: EzdxfWriter, tmp_path: Path) -> None:
+    def test_write_empty_file(self, writer: EzdxfWriter, dxf_dir: Path) -> None:
         """Test writing an empty DXF file."""
-        file_path = tmp_path / "empty.dxf"
+        file_path = dxf_dir / "empty.dxf"
         writer.write([], file_path)
         assert file_path.exists()
 
-    def test_write_single_line(
-        self,
-        writer: EzdxfWriter,
-        reader: EzdxfReader,
-        tmp_path: Path
-    ) -> None:
-        """Test writing a single line."""
-        line = Line(
-            start=Point(0.0, 0.0),
-            end=Point(100.0, 50.0),
-            layer="TEST",
-            color=1
-        )
-
-        file_path = tmp_path / "single_line.dxf"
-        writer.write([line], file_path)
-
-        # Verify by reading back
-        entities = reader.read(file_path)
-        assert len(entities) == 1
-        assert isinstance(entities[0], Line)
-        assert entities[0].start.x == 0.0
-        assert entities[0].end.x == 100.0
-
     def test_write_multiple_entities(
         self,
-        writer: EzdxfWriter,
-        reader: EzdxfReader,
-        tmp_path: Path
+        roundtrip: Callable[[list[Entity]], list[Entity]]
     ) -> None:
         """Test writing multiple entities."""
-        entities = [
-            Line(start=Point(0, 0), end=Point(100, 0), layer="CUT", color=1),
-            Line(start=Point(0, 50), end=Point(100, 50), layer="CREASE", color=5),
-            Arc(center=Point(50, 100), radius=25, start_angle=0, end_angle=180)
-        ]
-
-        file_path = tmp_path / "multiple.dxf"
-        writer.write(entities, file_path)
+        entities = _sample_entities()
 
         # Verify
-        read_entities = reader.read(file_path)
+        read_entities = roundtrip(entities)
         assert len(read_entities) == 3
-
-    def test_write_preserves_layer(
-        self,
-        writer: EzdxfWriter,
-        reader: EzdxfReader,
-        tmp_path: Path
-    ) -> None:
-        """Test that layer info is preserved after write/read."""
-        line = Line(
-            start=Point(0, 0),
-            end=Point(100, 0),
-            layer="MY_LAYER",
-            color=3
-        )
-
-        file_path = tmp_path / "layer_test.dxf"
-        writer.write([line], file_path)
-
-        entities = reader.read(file_path)
-        assert entities[0].layer == "MY_LAYER"
-
-    def test_write_preserves_color(
-        self,
-        writer: EzdxfWriter,
-        reader: EzdxfReader,
-        tmp_path: Path
-    ) -> None:
-        """Test that color info is preserved after write/read."""
-        line = Line(
-            start=Point(0, 0),
-            end=Point(100, 0),
-            layer="0",
-            color=6  # Magenta
-        )
-
-        file_path = tmp_path / "color_test.dxf"
-        writer.write([line], file_path)
-
-        entities = reader.read(file_path)
-        assert entities[0].color == 6
+        assert [type(e) for e in read_entities] == [type(e) for e in entities]
+        assert [e.layer for e in read_entities] == [e.layer for e in entities]
 
     def test_write_arc(
         self,
-        writer: EzdxfWriter,
-        reader: EzdxfReader,
-        tmp_path: Path
+        roundtrip: Callable[[list[Entity]], list[Entity]]
     ) -> None:
         """Test writing and reading back an arc."""
         arc = Arc(
@@ -221,42 +207,56 @@ class TestEzdxfWriter:
             layer="ARC_LAYER"
         )
 
-        file_path = tmp_path / "arc_test.dxf"
-        writer.write([arc], file_path)
-
-        entities = reader.read(file_path)
+        entities = roundtrip([arc])
         assert len(entities) == 1
         assert isinstance(entities[0], Arc)
         read_arc = entities[0]
-        assert read_arc.center.x == 100.0
-        assert read_arc.center.y == 100.0
-        assert read_arc.radius == 50.0
+        assert (read_arc.center.x, read_arc.center.y, read_arc.radius) == (
+            100.0, 100.0, 50.0
+        )
 
 
 class TestRoundTrip:
     """Test round-trip read/write/read consistency."""
 
-    def test_line_roundtrip(self, tmp_path: Path) -> None:
-        """Test line survives roundtrip."""
-        reader = EzdxfReader()
-        writer = EzdxfWriter()
-
+    @pytest.mark.parametrize(
+        "start,end,layer,color",
+        [
+            pytest.param((0.0, 0.0), (100.0, 50.0), "TEST", 1, id="single-line"),
+            pytest.param((0, 0), (100, 0), "MY_LAYER", 3, id="layer"),
+            pytest.param((0, 0), (100, 0), "0", 6, id="color"),  # Magenta
+            pytest.param(
+                (10.5, 20.5), (110.5, 120.5), "ROUNDTRIP", 4, id="roundtrip"
+            ),
+        ],
+    )
+    def test_line_attributes_preserved(
+        self,
+        roundtrip: Callable[[list[Entity]], list[Entity]],
+        start: tuple[float, float],
+        end: tuple[float, float],
+        layer: str,
+        color: int
+    ) -> None:
+        """Test a line's geometry, layer and color survive write/read."""
         original = Line(
-            start=Point(10.5, 20.5),
-            end=Point(110.5, 120.5),
-            layer="ROUNDTRIP",
-            color=4,
+            start=Point(*start),
+            end=Point(*end),
+            layer=layer,
+            color=color,
             category=LineCategory.CUT
         )
 
-        file_path = tmp_path / "roundtrip.dxf"
-        writer.write([original], file_path)
-        entities = reader.read(file_path)
+        entities = roundtrip([original])
 
         assert len(entities) == 1
         result = entities[0]
         assert isinstance(result, Line)
-        assert abs(result.start.x - original.start.x) < 0.001
-        assert abs(result.start.y - original.start.y) < 0.001
-        assert abs(result.end.x - original.end.x) < 0.001
-        assert abs(result.end.y - original.end.y) < 0.001
+        assert (
+            result.start.x, result.start.y, result.end.x, result.end.y
+        ) == pytest.approx(
+            (original.start.x, original.start.y, original.end.x, original.end.y),
+            abs=1e-3
+        )
+        assert result.layer == layer
+        assert result.color == color
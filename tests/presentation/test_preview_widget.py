@@ -1,36 +1,47 @@
 """Tests for PreviewWidget."""
 from __future__ import annotations
 
+from typing import Iterator
+
 import pytest
 from pytestqt.qtbot import QtBot
 from PyQt6.QtCore import Qt, QPointF
 from PyQt6.QtGui import QPainter
+from PyQt6.QtWidgets import QApplication
 
 from src.presentation.widgets.preview_widget import PreviewWidget
 from src.domain.entities.point import Point
 from src.domain.entities.line import Line
 from src.domain.entities.arc import Arc
+from src.domain.entities.polyline import Polyline, PolylineVertex
 from src.domain.entities.bounding_box import BoundingBox
 
 
+@pytest.fixture(scope="module")
+def default_widget(qapp: QApplication) -> Iterator[PreviewWidget]:
+    """
+    Create one untouched PreviewWidget for tests that only read its defaults.
+
+    Tests that zoom, pan, toggle or set entities build their own widget.
+    """
+    widget = PreviewWidget()
+    yield widget
+    widget.close()
+    widget.deleteLater()
+
+
 class TestPreviewWidget:
     """Test cases for PreviewWidget."""
 
-    def test_widget_creation(self, qtbot: QtBot) -> None:
+    def test_widget_creation(self, default_widget: PreviewWidget) -> None:
         """Test preview widget can be created."""
-        widget = PreviewWidget()
-        qtbot.addWidget(widget)
+        assert default_widget is not None
 
-        assert widget is not None
-
-    def test_widget_default_size(self, qtbot: QtBot) -> None:
+    def test_widget_default_size(self, default_widget: PreviewWidget) -> None:
         """Test preview widget has reasonable default size."""
-        widget = PreviewWidget()
-        qtbot.addWidget(widget)
-
         # Minimum size should be at least 400x300
-        assert widget.minimumWidth() >= 400
-        assert widget.minimumHeight() >= 300
+        assert default_widget.minimumWidth() >= 400
+        assert default_widget.minimumHeight() >= 300
 
     def test_set_entities_empty(self, qtbot: QtBot) -> None:
         """Test setting empty entity list."""
@@ -57,23 +68,39 @@ class TestPreviewWidget:
         """Test setting entities triggers widget update."""
         widget = PreviewWidget()
         qtbot.addWidget(widget)
-        widget.show()
 
         lines = [Line(start=Point(0, 0), end=Point(100, 0))]
 
-        # This should not raise any errors
+        # This should not raise any errors; grab() paints once offscreen
+        # instead of mapping a real window
         widget.set_entities(lines)
+        assert not widget.grab().isNull()
+
+    def test_paint_polyline_with_arc(self, qtbot: QtBot) -> None:
+        """Test painting a polyline with line and arc segments."""
+        widget = PreviewWidget()
+        qtbot.addWidget(widget)
+
+        polyline = Polyline(
+            vertices=(
+                PolylineVertex(0, 0, bulge=0.5),
+                PolylineVertex(50, 0),
+                PolylineVertex(50, 50),
+            ),
+            closed=True,
+        )
+        widget.set_entities([polyline])
+
+        # Rendering should not raise any errors
+        assert not widget.grab().isNull()
 
 
 class TestPreviewWidgetZoom:
     """Test cases for zoom functionality."""
 
-    def test_initial_zoom_level(self, qtbot: QtBot) -> None:
+    def test_initial_zoom_level(self, default_widget: PreviewWidget) -> None:
         """Test initial zoom level is 1.0."""
-        widget = PreviewWidget()
-        qtbot.addWidget(widget)
-
-        assert widget.zoom_level == 1.0
+        assert default_widget.zoom_level == 1.0
 
     def test_zoom_in(self, qtbot: QtBot) -> None:
         """Test zoom in increases zoom level."""
@@ -101,10 +128,15 @@ class TestPreviewWidgetZoom:
         widget = PreviewWidget()
         qtbot.addWidget(widget)
 
-        # Zoom out many times
-        for _ in range(20):
+        # Zoom out until the level stops changing; the bound only guards
+        # against a limit that is never reached
+        for _ in range(100):
+            previous = widget.zoom_level
             widget.zoom_out()
+            if widget.zoom_level == previous:
+                break
 
+        assert widget.zoom_level == previous
         assert widget.zoom_level >= 0.1  # Minimum zoom
 
     def test_zoom_has_maximum_limit(self, qtbot: QtBot) -> None:
@@ -112,10 +144,15 @@ class TestPreviewWidgetZoom:
         widget = PreviewWidget()
         qtbot.addWidget(widget)
 
-        # Zoom in many times
-        for _ in range(20):
+        # Zoom in until the level stops changing; the bound only guards
+        # against a limit that is never reached
+        for _ in range(100):
+            previous = widget.zoom_level
             widget.zoom_in()
+            if widget.zoom_level == previous:
+                break
 
+        assert widget.zoom_level == previous
         assert widget.zoom_level <= 10.0  # Maximum zoom
 
     def test_zoom_to_fit(self, qtbot: QtBot) -> None:
@@ -151,12 +188,9 @@ class TestPreviewWidgetZoom:
 class TestPreviewWidgetPan:
     """Test cases for pan functionality."""
 
-    def test_initial_pan_offset(self, qtbot: QtBot) -> None:
+    def test_initial_pan_offset(self, default_widget: PreviewWidget) -> None:
         """Test initial pan offset is (0, 0)."""
-        widget = PreviewWidget()
-        qtbot.addWidget(widget)
-
-        assert widget.pan_offset == QPointF(0, 0)
+        assert default_widget.pan_offset == QPointF(0, 0)
 
     def test_pan_by_offset(self, qtbot: QtBot) -> None:
         """Test panning by offset changes pan position."""
@@ -172,13 +206,10 @@ class TestPreviewWidgetPan:
 class TestPreviewWidgetDisplay:
     """Test cases for display settings."""
 
-    def test_background_color_default(self, qtbot: QtBot) -> None:
+    def test_background_color_default(self, default_widget: PreviewWidget) -> None:
         """Test default background color is set."""
-        widget = PreviewWidget()
-        qtbot.addWidget(widget)
-
         # Should have a background color property
-        assert hasattr(widget, 'background_color')
+        assert hasattr(default_widget, 'background_color')
 
     def test_show_grid_toggle(self, qtbot: QtBot) -> None:
         """Test grid visibility can be toggled."""
@@ -190,9 +221,6 @@ class TestPreviewWidgetDisplay:
 
         assert widget.show_grid != initial_state
 
-    def test_antialias_enabled(self, qtbot: QtBot) -> None:
+    def test_antialias_enabled(self, default_widget: PreviewWidget) -> None:
         """Test antialiasing is enabled by default."""
-        widget = PreviewWidget()
-        qtbot.addWidget(widget)
-
-        assert widget.antialias_enabled is True
+        assert default_widget.antialias_enabled is True